@@ -0,0 +1,65 @@
+"""
+기존 매물 중복 판정 마이크로 벤치마크
+- 선형 탐색(list) vs AuctionIndex(dict) 비교
+
+실행: python -m benchmarks.bench_auction_index
+"""
+
+import random
+import time
+
+from utils.auction_index import AuctionIndex
+
+
+def linear_lookup(data, case_id):
+    for item in data:
+        if item["case_id"] == case_id:
+            return item
+    return None
+
+
+def make_rows(n):
+    return [
+        {
+            "id": i,
+            "case_id": f"2024타경{i:06d}",
+            "bo_cd": f"B000{210 + i % 20}",
+            "failed_auction_count": i % 3,
+        }
+        for i in range(n)
+    ]
+
+
+def run(n, lookups=500):
+    rows = make_rows(n)
+    queries = [random.choice(rows) for _ in range(lookups // 2)]
+    queries += [
+        {"case_id": f"2099타경{i:06d}", "bo_cd": "B000210"}
+        for i in range(lookups - len(queries))
+    ]
+
+    started = time.perf_counter()
+    for q in queries:
+        linear_lookup(rows, q["case_id"])
+    linear = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = AuctionIndex(rows)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for q in queries:
+        index.get(q["case_id"], q["bo_cd"])
+    indexed = time.perf_counter() - started
+
+    print(
+        f"rows={n:>7,} lookups={lookups}: "
+        f"linear {linear * 1000:8.1f}ms | "
+        f"index build {build * 1000:6.1f}ms + lookup {indexed * 1000:6.2f}ms | "
+        f"x{linear / max(build + indexed, 1e-9):,.0f}"
+    )
+
+
+if __name__ == "__main__":
+    for n in (10_000, 100_000):
+        run(n)
@@ -0,0 +1,275 @@
+"""
+크롤 → 저장 → 이미지 → 지오코딩 → 알림 end-to-end 벤치마크 (오프라인)
+- benchmarks.standin_server 를 같은 프로세스에서 띄우고 모든 외부 API 주소를 교체
+- 1회차(전체 신규) / 2회차(변경 없음, 중복 판정) 처리량 비교
+- 지연/오류 주입 옵션은 standin_server 와 동일
+- 결과 검증: 신규 건수 = fixture 크기, 2회차 신규 0건, 요청 수 상한 (실패 시 종료 코드 1)
+
+실행: python -m benchmarks.bench_crawl_e2e --regions 10 --items-per-region 200 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import tempfile
+import time
+
+# settings 로드 전 필수 환경변수 (실제 값은 stand-in 서버 주소로 교체)
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1")
+os.environ.setdefault(
+    "SUPABASE_KEY", "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoiYmVuY2gifQ.standin"
+)
+os.environ.setdefault("ADMIN_SECRET", "bench")
+
+from benchmarks.standin_server import (
+    CONFIG_KEY,
+    COUNTERS_KEY,
+    FIXTURES_KEY,
+    TABLES_KEY,
+    add_arguments,
+    config_from_args,
+    region_items,
+    start_server,
+)
+from config.settings import settings
+from core.supabase import create_supabase_client
+from repositories.auction_repository import AuctionRepository
+from services.auction_snapshot import AuctionSnapshot
+from services.crawler_engine import CrawlerEngine
+from services.crawler_service import CrawlerService
+from services.geocoding_service import GeocodingService
+from services.image_pipeline import ImagePipeline
+from services.image_store import ImageStore
+from services.message_renderer import MessageRenderer
+from services.notifier_service import NotifierService
+from services.region_scheduler import RegionScheduler
+from utils.geocode_cache import GeocodeCache
+from utils.rate_limiter import TokenBucket
+
+
+def bench_targets(regions: int) -> list:
+    return [
+        {"sido_code": "26", "sigu_code": f"{110 + i * 10:03d}"} for i in range(regions)
+    ]
+
+
+def use_standin(base_url: str):
+    """모든 외부 API 주소를 stand-in 서버로 변경"""
+    settings.COURTAUCTION_BASE_URL = base_url
+    settings.NAVER_GEOCODE_URL = f"{base_url}/map-geocode/v2/geocode"
+    settings.TELEGRAM_API_BASE_URL = base_url
+    settings.SLACK_API_BASE_URL = f"{base_url}/api"
+    settings.SUPABASE_URL = base_url
+
+
+async def crawl_once(args, base_url: str, workdir: str) -> dict:
+    """main.crawl_and_notify 와 같은 순서로 전 지역 1회 처리 → 지표"""
+    engine = CrawlerEngine(
+        rate_limiter=TokenBucket(args.rate, max(1.0, args.rate / 10)),
+        max_retries=args.max_retries,
+    )
+    auction_repo = AuctionRepository(
+        client=create_supabase_client(base_url, settings.SUPABASE_KEY)
+    )
+    geocoder = GeocodingService(
+        engine,
+        qps=args.geocode_qps,
+        cache=GeocodeCache(
+            os.path.join(workdir, "geocode.sqlite3"),
+            ttl_seconds=3600,
+            negative_ttl_seconds=3600,
+            max_entries=1_000_000,
+        ),
+    )
+    notifier = NotifierService(telegram_api_key="standin")
+    renderer = MessageRenderer()
+
+    snapshot = await asyncio.to_thread(AuctionSnapshot.load, auction_repo)
+    crawler = CrawlerService(
+        auction_repo,
+        snapshot,
+        engine=engine,
+        geocoder=geocoder,
+        image_store=ImageStore(os.path.join(workdir, "images")),
+    )
+    image_pipeline = ImagePipeline(crawler, workers=args.image_workers)
+    totals = {"new": 0, "updated": 0, "sent": 0}
+
+    async def crawl_region(idx: int, target: dict):
+        _, new_auctions, updated_auctions = await crawler.crawl_new_auctions_async(
+            [target]
+        )
+        totals["new"] += len(new_auctions)
+        totals["updated"] += len(updated_auctions)
+        if new_auctions:
+            ids = await asyncio.to_thread(auction_repo.insert_many, new_auctions)
+            for auction, auction_id in zip(new_auctions, ids):
+                auction["id"] = auction_id
+            snapshot.add_many(new_auctions)
+            jobs = [await image_pipeline.submit(a) for a in new_auctions]
+            thumbnails = await asyncio.gather(*jobs)
+            thumbnailed = [a for a, url in zip(new_auctions, thumbnails) if url]
+            if thumbnailed:
+                await asyncio.to_thread(
+                    auction_repo.upsert_many, thumbnailed, merge_existing=False
+                )
+
+            rule = {"id": 1, "name": "벤치마크"}
+            results = await notifier.send_many(
+                [
+                    {
+                        "type": "telegram",
+                        # 채팅방당 rate limit 분산
+                        "identifier": str(i % args.chats),
+                        "text": renderer.render(a, rule, "telegram"),
+                        "image_url": a.get("thumbnail_src"),
+                    }
+                    for i, a in enumerate(new_auctions)
+                ]
+            )
+            totals["sent"] += sum(results)
+        if updated_auctions:
+            await asyncio.to_thread(auction_repo.upsert_many, updated_auctions)
+
+    targets = bench_targets(args.regions)
+    started = time.perf_counter()
+    image_pipeline.start()
+    try:
+        result = await RegionScheduler(args.max_in_flight).run(targets, crawl_region)
+    finally:
+        await image_pipeline.close()
+        await engine.close()
+        await notifier.close()
+    elapsed = time.perf_counter() - started
+
+    return {
+        **totals,
+        **result,
+        "elapsed": elapsed,
+        "images_per_s": image_pipeline.images_per_second,
+    }
+
+
+def verify(args, app, runs: list) -> list:
+    """
+    회귀 검증 → 실패 메시지 목록
+    요청 수는 오류/429 주입이 없을 때만 확인 (재시도로 늘어나므로)
+    """
+    config, fixtures = app[CONFIG_KEY], app[FIXTURES_KEY]
+    region_results = [
+        region_items(config, fixtures, t["sido_code"], t["sigu_code"])
+        for t in bench_targets(args.regions)
+    ]
+    expected_new = len(
+        {
+            (item.get("srnSaNo"), item.get("boCd"))
+            for items in region_results
+            for item in items
+        }
+    )
+    first, second = runs
+    rows = app[TABLES_KEY].tables.get("auctions", [])
+    counters = app[COUNTERS_KEY]
+    failures = []
+
+    def check(ok: bool, message: str):
+        if not ok:
+            failures.append(message)
+
+    check(
+        first["new"] == expected_new,
+        f"1회차 신규 {first['new']}건 != fixture {expected_new}건",
+    )
+    check(first["updated"] == 0, f"1회차 업데이트 {first['updated']}건 (0 기대)")
+    check(second["new"] == 0, f"2회차 신규 {second['new']}건 (0 기대)")
+    check(second["updated"] == 0, f"2회차 업데이트 {second['updated']}건 (0 기대)")
+    check(
+        first["failed"] == second["failed"] == 0,
+        f"지역 실패 {first['failed']} / {second['failed']}",
+    )
+    check(len(rows) == expected_new, f"auctions 행 {len(rows)}건 != {expected_new}건")
+    if not args.fixtures and args.pictures_per_case > 0:
+        missing = sum(1 for row in rows if not row.get("thumbnail_src"))
+        check(missing == 0, f"thumbnail_src 없는 행 {missing}건")
+
+    injected = any(f.error_rate or f.throttle_rate for f in config.faults.values())
+    if not injected:
+        page_size = settings.CRAWL_PAGE_SIZE
+        pages = sum(
+            max(1, math.ceil(len(items) / page_size)) for items in region_results
+        )
+        chunks = sum(
+            math.ceil(len(items) / settings.DB_CHUNK_SIZE) for items in region_results
+        )
+        # 스냅샷 조회 (실행당 1000행 단위) + 지역별 insert / 썸네일 upsert chunk
+        postgrest_budget = 1 + (expected_new // 1000 + 1) + 2 * chunks
+        limits = {
+            "search": 2 * pages,
+            "image": expected_new,
+            "geocode": expected_new,
+            "telegram": expected_new,
+            "postgrest": postgrest_budget,
+        }
+        for group, limit in limits.items():
+            count = counters.get(group, 0)
+            check(count <= limit, f"{group} 요청 {count}건 > 상한 {limit}건")
+        check(
+            first["sent"] == expected_new,
+            f"알림 발송 {first['sent']}건 != {expected_new}건",
+        )
+    return failures
+
+
+async def run(args) -> list:
+    runner, base_url = await start_server(config_from_args(args))
+    use_standin(base_url)
+    # 벤치마크에서는 발송 rate limit 완화 (채팅방 수로 분산)
+    settings.TELEGRAM_GLOBAL_RATE = args.notify_rate
+    print(f"🧪 stand-in 서버: {base_url}")
+
+    try:
+        runs = []
+        with tempfile.TemporaryDirectory() as workdir:
+            for label in ("1회차 (전체 신규)", "2회차 (변경 없음)"):
+                stats = await crawl_once(args, base_url, workdir)
+                runs.append(stats)
+                items = args.regions * args.items_per_region
+                print(
+                    f"\n📊 {label}: {stats['elapsed']:.2f}s | "
+                    f"검색 결과 {items / stats['elapsed']:.1f} items/s | "
+                    f"신규 {stats['new']} / 업데이트 {stats['updated']} | "
+                    f"알림 {stats['sent']}건 | 이미지 {stats['images_per_s']:.1f}/s | "
+                    f"지역 성공 {stats['succeeded']} 실패 {stats['failed']}\n"
+                )
+            tables = runner.app[TABLES_KEY].tables
+            print(f"📡 요청 수: {runner.app[COUNTERS_KEY]}")
+            print(f"🗄 auctions 행 수: {len(tables.get('auctions', []))}")
+        return verify(args, runner.app, runs)
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 end-to-end 크롤 벤치마크")
+    add_arguments(parser)
+    parser.add_argument("--regions", type=int, default=5)
+    parser.add_argument("--rate", type=float, default=50.0, help="크롤 초당 요청 수")
+    parser.add_argument(
+        "--max-in-flight", type=int, default=settings.CRAWL_MAX_IN_FLIGHT
+    )
+    parser.add_argument("--max-retries", type=int, default=settings.CRAWL_MAX_RETRIES)
+    parser.add_argument("--image-workers", type=int, default=settings.IMAGE_WORKERS)
+    parser.add_argument("--geocode-qps", type=float, default=200.0)
+    parser.add_argument("--notify-rate", type=float, default=500.0)
+    parser.add_argument("--chats", type=int, default=100)
+    failures = asyncio.run(run(parser.parse_args()))
+    if failures:
+        for message in failures:
+            print(f"❌ {message}")
+        raise SystemExit(1)
+    print("✅ 검증 통과")
+
+
+if __name__ == "__main__":
+    main()
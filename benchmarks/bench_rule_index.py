@@ -0,0 +1,121 @@
+"""
+알림 규칙 매칭 벤치마크
+- 기존 방식(규칙 × 매물 전수 비교) vs RuleIndex 비교 (10k 규칙 × 1k 매물)
+
+실행: python -m benchmarks.bench_rule_index
+"""
+
+import random
+import time
+
+from services.rule_index import RuleIndex
+
+CATEGORIES = ["아파트", "다세대", "오피스텔", "단독주택", None]
+REGIONS = [("26", f"{sigu:03d}") for sigu in range(110, 530, 30)] + [
+    ("11", f"{sigu:03d}") for sigu in range(110, 750, 30)
+]
+
+
+def naive_match(rule, auction):
+    """기존 NotificationService._match_rule 로직"""
+    if rule.get("category") and rule["category"] != auction.get("category"):
+        return False
+    if rule.get("sido_code"):
+        if int(rule["sido_code"]) != int(auction.get("sido_code", 0)):
+            return False
+    if rule.get("sigu_code"):
+        rule_sigu = str(rule["sigu_code"])
+        auction_sigu = str(auction.get("sigu_code", "0"))
+        rule_sigu_trimmed = rule_sigu[2:] if len(rule_sigu) > 2 else rule_sigu
+        if rule_sigu_trimmed != auction_sigu:
+            return False
+    auction_price = float(auction.get("minimum_price") or 0)
+    if rule.get("price_min") and auction_price < float(rule["price_min"]):
+        return False
+    if rule.get("price_max") and auction_price > float(rule["price_max"]):
+        return False
+    try:
+        auction_area = float(auction.get("area") or 0)
+    except ValueError:
+        auction_area = 0
+    if rule.get("area_min") and auction_area < float(rule["area_min"]):
+        return False
+    if rule.get("area_max") and auction_area > float(rule["area_max"]):
+        return False
+    if rule.get("keyword") and rule["keyword"] not in auction.get("address", ""):
+        return False
+    return True
+
+
+def make_rules(n):
+    rules = []
+    for i in range(n):
+        sido, sigu = random.choice(REGIONS)
+        price_min = random.choice([None, 50_000_000, 100_000_000, 300_000_000])
+        rules.append(
+            {
+                "id": i,
+                "user_id": f"user-{i % 500}",
+                "sido_code": random.choice([sido, sido, None]),
+                "sigu_code": random.choice([sido + sigu, None]),
+                "category": random.choice(CATEGORIES),
+                "price_min": price_min,
+                "price_max": (
+                    (price_min or 0) + 200_000_000 if random.random() < 0.5 else None
+                ),
+                "area_min": random.choice([None, "59.0"]),
+                "area_max": None,
+                "keyword": random.choice([None, None, None, "해운대"]),
+            }
+        )
+    return rules
+
+
+def make_auctions(n):
+    auctions = []
+    for i in range(n):
+        sido, sigu = random.choice(REGIONS)
+        auctions.append(
+            {
+                "id": i,
+                "sido_code": sido,
+                "sigu_code": sigu,
+                "category": random.choice(CATEGORIES[:-1]),
+                "minimum_price": str(random.randint(10, 900) * 1_000_000),
+                "area": f"{random.uniform(20, 150):.2f}",
+                "address": random.choice(["부산 해운대구 우동", "서울 강남구 역삼동"]),
+            }
+        )
+    return auctions
+
+
+def main(n_rules=10_000, n_auctions=1_000):
+    random.seed(7)
+    rules = make_rules(n_rules)
+    auctions = make_auctions(n_auctions)
+
+    started = time.perf_counter()
+    naive = {a["id"]: {r["id"] for r in rules if naive_match(r, a)} for a in auctions}
+    naive_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = RuleIndex(rules)
+    build_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    indexed = {a["id"]: {r["id"] for r in index.match(a)} for a in auctions}
+    match_elapsed = time.perf_counter() - started
+
+    assert naive == indexed, "RuleIndex 결과가 기존 매칭과 다릅니다"
+    matches = sum(len(v) for v in naive.values())
+    print(f"rules={n_rules:,} auctions={n_auctions:,} matches={matches:,}")
+    print(f"  naive : {naive_elapsed * 1000:9.1f}ms")
+    print(
+        f"  index : {(build_elapsed + match_elapsed) * 1000:9.1f}ms "
+        f"(build {build_elapsed * 1000:.1f}ms + match {match_elapsed * 1000:.1f}ms)"
+    )
+    print(f"  x{naive_elapsed / (build_elapsed + match_elapsed):.1f}")
+
+
+if __name__ == "__main__":
+    main()
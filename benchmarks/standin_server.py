@@ -0,0 +1,603 @@
+"""
+외부 API 로컬 stand-in 서버 (오프라인 테스트 / 벤치마크용)
+- 법원경매 검색 / 이미지 목록, 네이버 지오코딩, Telegram Bot API, Slack, Supabase(PostgREST)
+- 응답 지연(latency, jitter)과 오류(5xx / 429) 주입
+- fixture 재생: HTTP_RECORD_DIR 로 기록한 JSONL 또는 debug_save_json 덤프(./debug)
+
+실행: python -m benchmarks.standin_server --port 8099 --latency 0.05 --error-rate 0.02
+앱 설정 (.env):
+    COURTAUCTION_BASE_URL=http://127.0.0.1:8099
+    NAVER_GEOCODE_URL=http://127.0.0.1:8099/map-geocode/v2/geocode
+    TELEGRAM_API_BASE_URL=http://127.0.0.1:8099
+    SLACK_API_BASE_URL=http://127.0.0.1:8099/api
+    SUPABASE_URL=http://127.0.0.1:8099
+"""
+
+import argparse
+import asyncio
+import base64
+import glob
+import hashlib
+import io
+import json
+import math
+import os
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+SEARCH_PATH = "/pgj/pgjsearch/searchControllerMain.on"
+IMAGE_LIST_PATH = "/pgj/pgj15B/selectAuctnCsSrchRslt.on"
+
+
+@lru_cache
+def sample_jpeg() -> bytes:
+    """기본 사진 데이터 (Pillow가 있으면 실제 JPEG, 없으면 JPEG 마커만 있는 더미)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return b"\xff\xd8" + b"\x00" * 1024 + b"\xff\xd9"
+    buffer = io.BytesIO()
+    Image.new("RGB", (1280, 960), (120, 120, 120)).save(buffer, "JPEG", quality=85)
+    return buffer.getvalue()
+
+
+@dataclass
+class Faults:
+    """엔드포인트 그룹별 지연/오류 주입 설정"""
+
+    latency: float = 0.0  # 기본 지연(초)
+    jitter: float = 0.0  # 추가 지연 최대값(초, 균등분포)
+    error_rate: float = 0.0  # 5xx 응답 비율
+    throttle_rate: float = 0.0  # 429 응답 비율
+    retry_after: int = 1  # 429 응답의 Retry-After(초)
+
+
+@dataclass
+class StandinConfig:
+    items_per_region: int = 120
+    pictures_per_case: int = 3
+    picture_size: int = 0  # 0 이면 샘플 JPEG, 아니면 해당 바이트 수의 더미 데이터
+    fixtures_dir: Optional[str] = None
+    faults: Dict[str, Faults] = field(default_factory=dict)
+    seed: int = 42
+
+    def faults_for(self, group: str) -> Faults:
+        return self.faults.get(group) or self.faults.get("default") or Faults()
+
+
+# ---------------------------
+# 🔹 Fixtures (record / replay)
+# ---------------------------
+
+
+class FixtureStore:
+    """
+    기록된 응답 재생
+    - search: (시도, 시군구) → 원본 검색 결과 목록 (페이지는 요청에 맞게 다시 자름)
+    - image: 사건번호 → csPicLst
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.search: Dict[Tuple[str, str], List[Dict]] = {}
+        self.images: Dict[str, List[Dict]] = {}
+        if path:
+            self._load(path)
+
+    def _load(self, path: str):
+        # HTTP_RECORD_DIR 기록 (JSONL)
+        for file in glob.glob(os.path.join(path, "*.jsonl")):
+            with open(file, encoding="utf-8") as f:
+                for line in f:
+                    record = json.loads(line)
+                    self._add_record(record)
+        # debug_save_json 덤프
+        for file in glob.glob(os.path.join(path, "*.json")):
+            with open(file, encoding="utf-8") as f:
+                dump = json.load(f)
+            if "raw_results" in dump:
+                key = (str(dump["sido_code"]), str(dump["sigu_code"]))
+                self._merge_search(key, dump["raw_results"])
+        print(
+            f"🗂 fixture 로드: 검색 {len(self.search)}개 지역, 이미지 {len(self.images)}건"
+        )
+
+    def _add_record(self, record: Dict):
+        request = record.get("request") or {}
+        data = (record.get("response") or {}).get("data") or {}
+        if record["url"].endswith(SEARCH_PATH):
+            cond = request.get("dma_srchGdsDtlSrchInfo") or {}
+            key = (str(cond.get("rprsAdongSdCd")), str(cond.get("rprsAdongSggCd")))
+            self._merge_search(key, data.get("dlt_srchResult") or [])
+        elif record["url"].endswith(IMAGE_LIST_PATH):
+            cs_no = (request.get("dma_srchGdsDtlSrch") or {}).get("csNo")
+            pictures = (data.get("dma_result") or {}).get("csPicLst") or []
+            if cs_no:
+                self.images[cs_no] = pictures
+
+    def _merge_search(self, key: Tuple[str, str], items: List[Dict]):
+        bucket = self.search.setdefault(key, [])
+        seen = {(i.get("srnSaNo"), i.get("boCd")) for i in bucket}
+        for item in items:
+            if (item.get("srnSaNo"), item.get("boCd")) not in seen:
+                bucket.append(item)
+                seen.add((item.get("srnSaNo"), item.get("boCd")))
+
+
+# ---------------------------
+# 🔹 Synthetic data
+# ---------------------------
+
+
+def synthetic_items(sido: str, sigu: str, count: int) -> List[Dict]:
+    """지역별로 항상 같은 결과를 만드는 가짜 검색 결과"""
+    rng = random.Random(f"{sido}-{sigu}")
+    base_date = datetime.now() + timedelta(days=1)
+    items = []
+    for i in range(count):
+        price = rng.randrange(5_000, 200_000) * 10_000
+        items.append(
+            {
+                "srnSaNo": f"2024타경{int(sido) * 1000 + int(sigu) % 1000:05d}{i:04d}",
+                "boCd": f"B{sido}{sigu}",
+                "saNo": f"2024013{sido}{sigu}{i:04d}",
+                "docid": f"DOC{sido}{sigu}{i:05d}",
+                "jiwonNm": "부산지방법원",
+                "dspslUsgNm": rng.choice(["아파트", "다세대", "오피스텔", "단독주택"]),
+                "printSt": f"부산광역시 테스트구 테스트동 {i + 1}번지",
+                "pjbBuldList": f"철근콘크리트조 {rng.uniform(20, 150):.2f}㎡",
+                "gamevalAmt": str(int(price * 1.3)),
+                "notifyMinmaePrice1": str(price),
+                "yuchalCnt": str(rng.randint(0, 3)),
+                "maeGiil": (base_date + timedelta(days=i % 14)).strftime("%Y%m%d"),
+                "mulBigo": "",
+                "bgPlaceRdAllAddr": f"부산광역시 테스트구 테스트로 {i + 1}",
+            }
+        )
+    return items
+
+
+def synthetic_pictures(cs_no: str, count: int, size: int) -> List[Dict]:
+    pictures = []
+    for seq in range(1, count + 1):
+        if size:
+            seed = hashlib.sha256(f"{cs_no}-{seq}".encode()).digest()
+            data = (seed * (size // len(seed) + 1))[:size]
+        else:
+            data = sample_jpeg()
+        pictures.append(
+            {
+                "csNo": cs_no,
+                "cortAuctnPicSeq": str(seq),
+                "pageSeq": str(seq),
+                "picFile": base64.b64encode(data).decode(),
+            }
+        )
+    return pictures
+
+
+def region_items(
+    config: StandinConfig, fixtures: FixtureStore, sido: str, sigu: str
+) -> List[Dict]:
+    """지역 검색 결과 전체 (fixture 우선, 없으면 가짜 결과) → 벤치마크 기대값 계산에도 사용"""
+    items = fixtures.search.get((str(sido), str(sigu)))
+    if items is None:
+        items = synthetic_items(str(sido), str(sigu), config.items_per_region)
+    return items
+
+
+# ---------------------------
+# 🔹 PostgREST (in-memory)
+# ---------------------------
+
+
+class PostgrestTables:
+    """supabase-py가 사용하는 PostgREST 기능의 최소 구현 (메모리 테이블)"""
+
+    FILTER_OPS = ("eq", "neq", "gt", "gte", "lt", "lte", "in", "is")
+
+    def __init__(self):
+        self.tables: Dict[str, List[Dict]] = {}
+        self._next_id = 1
+
+    @staticmethod
+    def _coerce(row_value, raw: str):
+        if raw == "null":
+            return None
+        if isinstance(row_value, bool):
+            return raw == "true"
+        if isinstance(row_value, (int, float)):
+            try:
+                return type(row_value)(raw)
+            except ValueError:
+                return raw
+        return raw
+
+    def _match(self, row: Dict, column: str, expr: str) -> bool:
+        negate = expr.startswith("not.")
+        if negate:
+            expr = expr[4:]
+        op, _, raw = expr.partition(".")
+        value = row.get(column)
+        if op == "is":
+            result = value is None if raw == "null" else str(value).lower() == raw
+        elif op == "in":
+            options = [v.strip().strip('"') for v in raw.strip("()").split(",")]
+            result = str(value) in options
+        else:
+            target = self._coerce(value, raw)
+            if value is None or target is None:
+                result = op == "eq" and value is target
+            else:
+                try:
+                    a, b = value, target
+                    if not isinstance(a, type(b)):
+                        a, b = str(a), str(b)
+                    result = {
+                        "eq": a == b,
+                        "neq": a != b,
+                        "gt": a > b,
+                        "gte": a >= b,
+                        "lt": a < b,
+                        "lte": a <= b,
+                    }[op]
+                except (KeyError, TypeError):
+                    result = False
+        return not result if negate else result
+
+    def _filter(self, rows: List[Dict], query) -> List[Dict]:
+        for column, expr in query.items():
+            if column in (
+                "select",
+                "order",
+                "limit",
+                "offset",
+                "on_conflict",
+                "columns",
+            ):
+                continue
+            op = (
+                expr.split(".", 2)[1] if expr.startswith("not.") else expr.split(".")[0]
+            )
+            if op not in self.FILTER_OPS:
+                continue
+            rows = [row for row in rows if self._match(row, column, expr)]
+        return rows
+
+    @staticmethod
+    def _project(rows: List[Dict], select: str) -> List[Dict]:
+        columns = [c.strip() for c in (select or "*").split(",") if c.strip()]
+        if not columns or "*" in columns:
+            return [dict(row) for row in rows]
+        return [{c: row.get(c) for c in columns} for row in rows]
+
+    def select(self, table: str, query) -> List[Dict]:
+        rows = self._filter(self.tables.get(table, []), query)
+        for order in reversed(query.getall("order", [])):
+            for part in reversed(order.split(",")):
+                column, _, direction = part.partition(".")
+                rows = sorted(
+                    rows,
+                    key=lambda r: (r.get(column) is None, str(r.get(column))),
+                    reverse=direction.startswith("desc"),
+                )
+        offset = int(query.get("offset", 0))
+        limit = query.get("limit")
+        rows = rows[offset : offset + int(limit)] if limit else rows[offset:]
+        return self._project(rows, query.get("select"))
+
+    def insert(self, table: str, rows: List[Dict], on_conflict: Optional[str]):
+        bucket = self.tables.setdefault(table, [])
+        keys = on_conflict.split(",") if on_conflict else None
+        result = []
+        for row in rows:
+            existing = None
+            if keys:
+                existing = next(
+                    (r for r in bucket if all(r.get(k) == row.get(k) for k in keys)),
+                    None,
+                )
+            if existing is not None:
+                existing.update(row)
+                result.append(existing)
+                continue
+            row = dict(row)
+            row.setdefault("id", self._next_id)
+            row.setdefault("created_at", datetime.now().isoformat())
+            self._next_id += 1
+            bucket.append(row)
+            result.append(row)
+        return result
+
+    def update(self, table: str, query, values: Dict) -> List[Dict]:
+        rows = self._filter(self.tables.get(table, []), query)
+        for row in rows:
+            row.update(values)
+        return rows
+
+
+# ---------------------------
+# 🔹 App
+# ---------------------------
+
+# 벤치마크/테스트에서 서버 상태를 조회하기 위한 앱 키
+CONFIG_KEY = web.AppKey("config", StandinConfig)
+FIXTURES_KEY = web.AppKey("fixtures", FixtureStore)
+TABLES_KEY = web.AppKey("tables", PostgrestTables)
+COUNTERS_KEY = web.AppKey("counters", dict)
+
+
+def build_app(config: StandinConfig) -> web.Application:
+    fixtures = FixtureStore(config.fixtures_dir)
+    tables = PostgrestTables()
+    rng = random.Random(config.seed)
+    counters: Dict[str, int] = {}
+
+    def group_of(path: str) -> str:
+        if path.endswith(SEARCH_PATH):
+            return "search"
+        if path.endswith(IMAGE_LIST_PATH):
+            return "image"
+        if "geocode" in path:
+            return "geocode"
+        if path.startswith("/bot"):
+            return "telegram"
+        if path.startswith("/api/"):
+            return "slack"
+        if path.startswith("/rest/"):
+            return "postgrest"
+        return "default"
+
+    @web.middleware
+    async def inject_faults(request: web.Request, handler):
+        group = group_of(request.path)
+        counters[group] = counters.get(group, 0) + 1
+        faults = config.faults_for(group)
+        delay = faults.latency + rng.uniform(0, faults.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        roll = rng.random()
+        if roll < faults.throttle_rate:
+            return web.json_response(
+                {
+                    "ok": False,
+                    "error_code": 429,
+                    "parameters": {"retry_after": faults.retry_after},
+                },
+                status=429,
+                headers={"Retry-After": str(faults.retry_after)},
+            )
+        if roll < faults.throttle_rate + faults.error_rate:
+            if group == "postgrest":
+                # postgrest-py 가 파싱할 수 있는 오류 형식
+                return web.json_response(
+                    {
+                        "code": "PGRST000",
+                        "message": "injected",
+                        "details": None,
+                        "hint": None,
+                    },
+                    status=503,
+                )
+            return web.json_response({"error": "injected"}, status=503)
+        return await handler(request)
+
+    # --- 법원경매 ---
+
+    async def search(request: web.Request):
+        payload = await request.json()
+        page = payload.get("dma_pageInfo") or {}
+        cond = payload.get("dma_srchGdsDtlSrchInfo") or {}
+        items = region_items(
+            config, fixtures, cond.get("rprsAdongSdCd"), cond.get("rprsAdongSggCd")
+        )
+
+        page_no = int(page.get("pageNo") or 1)
+        page_size = int(page.get("pageSize") or 10)
+        start = (page_no - 1) * page_size
+        return web.json_response(
+            {
+                "data": {
+                    "dlt_srchResult": items[start : start + page_size],
+                    "dma_pageInfo": {
+                        "pageNo": page_no,
+                        "pageSize": page_size,
+                        "totalCnt": str(len(items)),
+                        "totalPages": math.ceil(len(items) / page_size),
+                    },
+                }
+            }
+        )
+
+    async def image_list(request: web.Request):
+        payload = await request.json()
+        cs_no = (payload.get("dma_srchGdsDtlSrch") or {}).get("csNo")
+        pictures = fixtures.images.get(cs_no)
+        if pictures is None:
+            pictures = synthetic_pictures(
+                cs_no, config.pictures_per_case, config.picture_size
+            )
+        return web.json_response({"data": {"dma_result": {"csPicLst": pictures}}})
+
+    # --- 네이버 지오코딩 ---
+
+    async def geocode(request: web.Request):
+        query = request.query.get("query", "")
+        if not query:
+            return web.json_response({"status": "OK", "addresses": []})
+        digest = int(hashlib.md5(query.encode()).hexdigest(), 16)
+        return web.json_response(
+            {
+                "status": "OK",
+                "addresses": [
+                    {
+                        "x": f"{129.0 + (digest % 10_000) / 100_000:.7f}",
+                        "y": f"{35.1 + (digest // 10_000 % 10_000) / 100_000:.7f}",
+                        "jibunAddress": query,
+                        "roadAddress": query,
+                    }
+                ],
+            }
+        )
+
+    # --- Telegram / Slack ---
+
+    async def telegram(request: web.Request):
+        method = request.match_info["method"]
+        payload = await request.json() if request.can_read_body else {}
+        result = {
+            "message_id": counters.get("telegram", 0),
+            "chat": {"id": payload.get("chat_id")},
+        }
+        if method == "sendMediaGroup":
+            result = [result for _ in payload.get("media", [])]
+        return web.json_response({"ok": True, "result": result})
+
+    async def slack(request: web.Request):
+        payload = await request.json()
+        return web.json_response(
+            {"ok": True, "channel": payload.get("channel"), "ts": "0"}
+        )
+
+    # --- PostgREST ---
+
+    def postgrest_response(request: web.Request, rows: List[Dict], status: int = 200):
+        if request.headers.get("Accept") == "application/vnd.pgrst.object+json":
+            if len(rows) != 1:
+                return web.json_response(
+                    {
+                        "code": "PGRST116",
+                        "details": f"The result contains {len(rows)} rows",
+                        "hint": None,
+                        "message": "JSON object requested, multiple (or no) rows returned",
+                    },
+                    status=406,
+                )
+            return web.json_response(rows[0], status=status)
+        return web.json_response(rows, status=status)
+
+    async def rest_get(request: web.Request):
+        rows = tables.select(request.match_info["table"], request.query)
+        return postgrest_response(request, rows)
+
+    async def rest_post(request: web.Request):
+        body = await request.json()
+        rows = body if isinstance(body, list) else [body]
+        on_conflict = request.query.get("on_conflict")
+        if "merge-duplicates" not in request.headers.get("Prefer", ""):
+            on_conflict = None
+        result = tables.insert(request.match_info["table"], rows, on_conflict)
+        return postgrest_response(
+            request, tables._project(result, request.query.get("select")), 201
+        )
+
+    async def rest_patch(request: web.Request):
+        rows = tables.update(
+            request.match_info["table"], request.query, await request.json()
+        )
+        return postgrest_response(request, tables._project(rows, "*"))
+
+    async def stats(request: web.Request):
+        return web.json_response(
+            {
+                "requests": counters,
+                "tables": {name: len(rows) for name, rows in tables.tables.items()},
+            }
+        )
+
+    app = web.Application(middlewares=[inject_faults], client_max_size=64 * 1024**2)
+    app[CONFIG_KEY] = config
+    app[FIXTURES_KEY] = fixtures
+    app[TABLES_KEY] = tables
+    app[COUNTERS_KEY] = counters
+    app.router.add_post(SEARCH_PATH, search)
+    app.router.add_post(IMAGE_LIST_PATH, image_list)
+    app.router.add_get("/map-geocode/v2/geocode", geocode)
+    app.router.add_post(r"/bot{token}/{method}", telegram)
+    app.router.add_post("/api/chat.postMessage", slack)
+    app.router.add_get("/rest/v1/{table}", rest_get)
+    app.router.add_post("/rest/v1/{table}", rest_post)
+    app.router.add_patch("/rest/v1/{table}", rest_patch)
+    app.router.add_get("/_standin/stats", stats)
+    return app
+
+
+async def start_server(
+    config: StandinConfig, host: str = "127.0.0.1", port: int = 0
+) -> Tuple[web.AppRunner, str]:
+    """서버 시작 → (runner, base_url). port=0 이면 빈 포트 사용"""
+    runner = web.AppRunner(build_app(config), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{bound_port}"
+
+
+def parse_faults(args) -> Dict[str, Faults]:
+    """--latency 등 공통 값 + --fault group:key=value,... 개별 설정"""
+    faults = {
+        "default": Faults(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+        )
+    }
+    for spec in args.fault or []:
+        group, _, options = spec.partition(":")
+        values = dict(faults["default"].__dict__)
+        for option in filter(None, options.split(",")):
+            key, _, value = option.partition("=")
+            values[key] = type(values[key])(value)
+        faults[group] = Faults(**values)
+    return faults
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--items-per-region", type=int, default=120)
+    parser.add_argument("--pictures-per-case", type=int, default=3)
+    parser.add_argument("--picture-size", type=int, default=0)
+    parser.add_argument("--fixtures", help="HTTP_RECORD_DIR 또는 ./debug 덤프 디렉토리")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--fault",
+        action="append",
+        help="그룹별 설정, 예: search:latency=0.3,error_rate=0.05 "
+        "(그룹: search, image, geocode, telegram, slack, postgrest)",
+    )
+
+
+def config_from_args(args) -> StandinConfig:
+    return StandinConfig(
+        items_per_region=args.items_per_region,
+        pictures_per_case=args.pictures_per_case,
+        picture_size=args.picture_size,
+        fixtures_dir=args.fixtures,
+        faults=parse_faults(args),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="외부 API 로컬 stand-in 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    add_arguments(parser)
+    args = parser.parse_args()
+    web.run_app(
+        build_app(config_from_args(args)),
+        host=args.host,
+        port=args.port,
+        access_log=None,
+    )
+
+
+if __name__ == "__main__":
+    main()
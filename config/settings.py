@@ -18,6 +18,90 @@ class Settings(BaseSettings):
     ADMIN_SECRET: str
     DEBUG: bool = False
 
+    # ====== 외부 API 주소 (로컬 stand-in 서버로 바꿔 오프라인 테스트/벤치마크) ======
+    COURTAUCTION_BASE_URL: str = "https://www.courtauction.go.kr"
+    NAVER_GEOCODE_URL: str = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
+    TELEGRAM_API_BASE_URL: str = "https://api.telegram.org"
+    SLACK_API_BASE_URL: str = "https://slack.com/api"
+    HTTP_RECORD_DIR: str | None = None  # 설정 시 법원경매 응답을 fixture로 기록
+
+    # ====== 크롤러 설정 ======
+    CRAWL_PAGE_SIZE: int = 50  # 검색 결과 페이지 크기
+    CRAWL_PAGE_CONCURRENCY: int = 1  # 페이지 동시 요청 수 (1 = 순차)
+    CRAWL_HTTP_LIMIT: int = 20  # 공유 세션 전체 동시 연결 수
+    CRAWL_HTTP_LIMIT_PER_HOST: int = 4  # 호스트별 동시 연결 수
+    CRAWL_HTTP_TIMEOUT: float = 30.0  # 요청 타임아웃(초)
+    CRAWL_RATE_PER_SEC: float = 1.0  # 법원경매 사이트 초당 요청 수 (IP 차단 방지)
+    CRAWL_RATE_BURST: float = 2.0  # 순간 허용 요청 수
+    CRAWL_MAX_IN_FLIGHT: int = 3  # 동시에 크롤링하는 지역 수
+    CRAWL_MAX_RETRIES: int = 3  # 429/5xx 재시도 횟수
+    CRAWL_BACKOFF_BASE: float = 2.0  # 재시도 백오프 기본 대기(초)
+    CRAWL_BACKOFF_MAX: float = 60.0  # 재시도 백오프 최대 대기(초)
+    # 변경 없는 지역은 첫/마지막 페이지만 확인 후 건너뜀 (기본 꺼짐)
+    # 켜면 중간 페이지의 최저가/매각기일/유찰 변경은 최대 CRAWL_FULL_RESYNC_HOURS 늦게 반영됨
+    CRAWL_INCREMENTAL: bool = False
+    CRAWL_FULL_RESYNC_HOURS: float = 72  # 체크포인트와 무관하게 전체 동기화 주기
+    CRAWL_CHECKPOINT_PATH: str = "./data/crawl_checkpoint.sqlite3"
+    SEEN_CASES_PATH: str = "./data/seen_cases.sqlite3"  # 누적 사건번호 인덱스
+    SEEN_CASES_PAGE_SIZE: int = 1000  # 사건번호 증분 조회 페이지 크기
+
+    # ====== DB 일괄 처리 ======
+    DB_CHUNK_SIZE: int = 500  # insert/upsert 1회 요청당 최대 행 수
+
+    # ====== Supabase 커넥션 풀 ======
+    SUPABASE_POOL_SIZE: int = 20  # 최대 동시 연결 수
+    SUPABASE_KEEPALIVE_CONNECTIONS: int = 10  # 유지할 keep-alive 연결 수
+    SUPABASE_KEEPALIVE_EXPIRY: float = 60.0  # 유휴 연결 유지 시간(초)
+    SUPABASE_TIMEOUT: float = 30.0  # 요청 타임아웃(초)
+    SUPABASE_CONNECT_TIMEOUT: float = 5.0  # 연결 타임아웃(초)
+
+    # ====== 지역 코드 사전 ======
+    REGION_CODE_SNAPSHOT_PATH: str = "./data/region_codes.json"
+    REGION_CODE_REFRESH_HOURS: float = 24  # 시도/시군구 코드 재조회 주기
+
+    # ====== 알림 발송 ======
+    NOTIFY_MAX_IN_FLIGHT: int = 20  # 동시 발송 수
+    NOTIFY_MAX_RETRIES: int = 3  # 429/5xx 재시도 횟수
+    TELEGRAM_GLOBAL_RATE: float = 30.0  # 봇 전체 초당 메시지 수
+    TELEGRAM_PER_CHAT_RATE: float = 1.0  # 개인 채팅방 초당 메시지 수
+    TELEGRAM_PER_GROUP_RATE: float = 20 / 60  # 그룹 채팅방 초당 메시지 수
+    SLACK_PER_CHANNEL_RATE: float = 1.0  # Slack 채널 초당 메시지 수
+    NOTIFY_DIGEST_MAX_ITEMS: int = (
+        10  # 묶음 메시지 1건당 최대 매물 수 (Telegram 앨범 최대 10장)
+    )
+    NOTIFY_DIGEST_WINDOW: float = 1800.0  # 묶음 항목을 모으는 최대 시간(초)
+
+    # ====== 알림 발송 대기열 (outbox) ======
+    OUTBOX_PATH: str = "./data/notification_outbox.sqlite3"
+    OUTBOX_BATCH_SIZE: int = 50  # 워커 1회 발송 건수
+    OUTBOX_POLL_INTERVAL: float = 10.0  # 대기 항목 확인 주기(초)
+    OUTBOX_MAX_ATTEMPTS: int = 6  # 초과 시 dead letter
+    OUTBOX_BACKOFF_BASE: float = 30.0  # 재시도 대기 기본값(초)
+    OUTBOX_BACKOFF_MAX: float = 3600.0  # 재시도 대기 최대값(초)
+    OUTBOX_RETENTION_DAYS: float = 30  # 발송 완료 항목(멱등 키) 보관 기간
+
+    # ====== 알림 로그 ======
+    NOTIFY_LOG_BATCH_SIZE: int = 100  # 일괄 기록 건수
+    NOTIFY_LOG_FLUSH_INTERVAL: float = 5.0  # 주기적 기록 간격(초)
+    NOTIFY_LOG_MAX_RETRIES: int = 3  # 실패 batch 재시도 횟수
+    NOTIFY_LOG_BUFFER_MAX: int = 10_000  # 버퍼 최대 건수 (초과 시 오래된 것부터 폐기)
+
+    # ====== 이미지 파이프라인 ======
+    IMAGE_WORKERS: int = 4  # 이미지 수집 워커 수
+    IMAGE_QUEUE_SIZE: int = 200  # 대기 작업 최대 수
+    IMAGE_THUMBNAIL_SIZE: int = 320  # 알림용 썸네일 최대 가로/세로(px)
+    IMAGE_PREVIEW_SIZE: int = 1024  # 미리보기 최대 가로/세로(px)
+    IMAGE_VARIANT_QUALITY: int = 75  # 축소 이미지 JPEG 품질
+    IMAGE_RETRY_DAYS: int = 15  # 썸네일 누락 매물 재수집 대상 기간(일)
+
+    # ====== 지오코딩 캐시 ======
+    GEOCODE_CACHE_PATH: str = "./cache/geocode.sqlite3"
+    GEOCODE_CACHE_TTL_DAYS: float = 180  # 좌표 결과 보관 기간
+    GEOCODE_NEGATIVE_TTL_DAYS: float = 7  # 찾지 못한 주소 재조회 주기
+    GEOCODE_CACHE_MAX_ENTRIES: int = 100_000  # 초과 시 LRU 정리
+    GEOCODE_QPS: float = 10.0  # 네이버 지오코딩 초당 요청 수
+    GEOCODE_CONCURRENCY: int = 5  # 동시 요청 수
+
     # ====== pydantic v2 설정 ======
     model_config = SettingsConfigDict(
         env_file=".env",
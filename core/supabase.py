@@ -1,6 +1,50 @@
 # core/supabase.py
-from supabase import create_client
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+from supabase import Client, ClientOptions, create_client
+
 from config.settings import settings
 
+
+def create_supabase_client(url: str, key: str) -> Client:
+    """
+    커넥션 풀(httpx) 설정이 적용된 Supabase Client 생성
+    - keep-alive 연결을 재사용하여 요청마다 TCP/TLS 연결을 새로 맺지 않음
+    - httpx.Client는 스레드 안전 → asyncio.to_thread 작업 간 공유 가능
+    """
+    timeout = httpx.Timeout(
+        settings.SUPABASE_TIMEOUT, connect=settings.SUPABASE_CONNECT_TIMEOUT
+    )
+    http_client = httpx.Client(
+        limits=httpx.Limits(
+            max_connections=settings.SUPABASE_POOL_SIZE,
+            max_keepalive_connections=settings.SUPABASE_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.SUPABASE_KEEPALIVE_EXPIRY,
+        ),
+        timeout=timeout,
+        follow_redirects=True,
+        http2=True,
+    )
+    return create_client(
+        url,
+        key,
+        options=ClientOptions(
+            httpx_client=http_client, postgrest_client_timeout=timeout
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def _shared_client(url: str, key: str) -> Client:
+    return create_supabase_client(url, key)
+
+
+def get_supabase_client(url: Optional[str] = None, key: Optional[str] = None) -> Client:
+    """프로세스 전역 공유 Client (URL/키 조합당 1개, 기본값은 settings)"""
+    return _shared_client(url or settings.SUPABASE_URL, key or settings.SUPABASE_KEY)
+
+
 # 전역 Supabase Client (FastAPI 전역에서 사용 가능)
-supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+supabase = get_supabase_client()
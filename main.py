@@ -1,26 +1,34 @@
 # main.py
 import os
 import asyncio
-import requests
-from datetime import datetime
-from fastapi import FastAPI, Request
+from datetime import datetime, timedelta
+from fastapi import BackgroundTasks, FastAPI, Request
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from supabase import create_client
+from core.supabase import supabase
 
 
 from routers import router as api_router
 
 from utils.json_utils import debug_save_json
+from utils.geocode_cache import get_geocode_cache
 from services.crawler_service import CrawlerService
+from services.crawler_engine import CrawlerEngine
+from services.crawl_checkpoint import CrawlCheckpointStore
+from services.region_scheduler import RegionScheduler
+from services.image_pipeline import ImagePipeline
+from services.notification_log_sink import NotificationLogSink
+from services.notification_outbox import NotificationOutbox, OutboxWorker
 from services.notification_service import NotificationService
 from repositories.auction_repository import AuctionRepository
+from services.auction_snapshot import AuctionSnapshot
+from services.seen_case_index import SeenCaseIndex
 from repositories.notification_repository import NotificationRepository
 from services.notifier_service import NotifierService
 from services.crawl_log_service import CrawlLogService
+from services.region_code_service import RegionCodeService
 from repositories.crawl_log_repository import CrawlLogRepository
 from config.settings import settings
 
-
 print(settings)
 # --------------------------------------------------
 # ✅ FastAPI 앱 생성
@@ -30,9 +38,32 @@ app = FastAPI(title="CourtAuction Bot", version="1.0.0")
 
 app.include_router(api_router)
 # --------------------------------------------------
-# ✅ Supabase 클라이언트
+# ✅ 크롤러 HTTP 엔진 (프로세스 전역 커넥션 풀)
+# --------------------------------------------------
+crawler_engine = CrawlerEngine()
+# 지역별 증분 크롤 체크포인트 (변경 없는 지역은 첫 페이지만 확인)
+crawl_checkpoints = CrawlCheckpointStore() if settings.CRAWL_INCREMENTAL else None
+# 지금까지 저장된 전체 사건번호 (스냅샷 기간 밖 기존 매물 재알림 방지)
+seen_cases = SeenCaseIndex()
+
+# --------------------------------------------------
+# ✅ 알림 발송기 (프로세스 전역 세션 / rate limit 공유)
+# --------------------------------------------------
+notifier = NotifierService(
+    slack_token=settings.SLACK_TOKEN, telegram_api_key=settings.TELEGRAM_BOT_API_KEY
+)
+
+# --------------------------------------------------
+# ✅ 알림 발송 대기열 + 워커 (매칭과 별개로 상시 발송, 재시작 시 이어서 처리)
+# --------------------------------------------------
+notification_log_sink = NotificationLogSink(NotificationRepository(client=supabase))
+notification_outbox = NotificationOutbox()
+outbox_worker = OutboxWorker(notification_outbox, notifier, notification_log_sink)
+
+# --------------------------------------------------
+# ✅ 시도/시군구 코드 사전 (메모리, 주기적 갱신)
 # --------------------------------------------------
-supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+region_codes = RegionCodeService(supabase)
 
 # 기본 감시 대상 선언
 DEFAULT_DETECT_TARGET = [
@@ -60,8 +91,11 @@ async def health_check():
 # ✅ Telegram Webhook 처리
 # --------------------------------------------------
 @app.post("/")
-async def telegram_webhook(request: Request):
-    """Telegram Webhook Handler"""
+async def telegram_webhook(request: Request, background_tasks: BackgroundTasks):
+    """
+    Telegram Webhook Handler
+    Telegram에는 즉시 응답하고, 실제 처리(DB 조회/답장)는 응답 이후 백그라운드에서 수행
+    """
     try:
         data = await request.json()
     except Exception as e:
@@ -69,7 +103,15 @@ async def telegram_webhook(request: Request):
         return {"ok": False}
 
     print("📩 Telegram webhook received:", data)
+    background_tasks.add_task(handle_telegram_update, data)
+    return {"ok": True}
+
 
+async def handle_telegram_update(data: dict):
+    """
+    Telegram 업데이트 처리
+    동기 Supabase 쿼리는 스레드로 넘겨 이벤트 루프(다른 API 요청)를 막지 않음
+    """
     message = data.get("message", {})
     chat = message.get("chat", {})
     text = message.get("text", "")
@@ -78,7 +120,7 @@ async def telegram_webhook(request: Request):
     # 기본적인 파싱 실패 방지
     if not chat_id or not text:
         print("⚠️ Missing chat_id or text")
-        return {"ok": True}
+        return
 
     # ------------------------------------------------------------
     # 📌 START 명령 처리
@@ -89,31 +131,31 @@ async def telegram_webhook(request: Request):
             await send_message(
                 chat_id, "❌ 인증 토큰이 없습니다. 웹사이트에서 다시 연결해주세요."
             )
-            return {"ok": True}
+            return
 
         token = parts[1].strip()
         print(f"🔍 Checking token: {token}")
 
         # --- 사용자 조회 (maybe_single + fail-safe) ---
         try:
-            res = (
+            res = await asyncio.to_thread(
                 supabase.table("users")
                 .select("id, email")
                 .eq("telegram_auth_token", token)
                 .maybe_single()
-                .execute()
+                .execute
             )
         except Exception as e:
             print("❌ Supabase error (users query):", e)
             await send_message(
                 chat_id, "⚠️ 서버 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
             )
-            return {"ok": True}
+            return
 
         # --- 토큰 유효성 검증 ---
         if res is None or res.data is None:
             await send_message(chat_id, "❌ 잘못된 토큰입니다. 다시 시도해주세요.")
-            return {"ok": True}
+            return
 
         user_id = res.data["id"]
         email = res.data["email"]
@@ -123,20 +165,20 @@ async def telegram_webhook(request: Request):
         #     기존 텔레그램 연동 여부 확인
         # ------------------------------------------------------------
         try:
-            existing_channel = (
+            existing_channel = await asyncio.to_thread(
                 supabase.table("notification_channels")
                 .select("id, identifier")
                 .eq("user_id", user_id)
                 .eq("type", "telegram")
                 .maybe_single()
-                .execute()
+                .execute
             )
         except Exception as e:
             print("❌ Supabase error (channel query):", e)
             await send_message(
                 chat_id, "⚠️ 서버 오류가 발생했습니다. 다시 시도해주세요."
             )
-            return {"ok": True}
+            return
 
         # --- 기존 채널 존재 ---
         if existing_channel and existing_channel.data:
@@ -147,7 +189,7 @@ async def telegram_webhook(request: Request):
                 await send_message(
                     chat_id, f"🔄 이미 텔레그램 연동이 완료되었습니다!\n\n계정: {email}"
                 )
-                return {"ok": True}
+                return
 
             # 다른 텔레그램과 이미 연결됨
             await send_message(
@@ -155,33 +197,40 @@ async def telegram_webhook(request: Request):
                 "⚠️ 이미 다른 텔레그램 계정과 연결된 상태입니다.\n"
                 "기존 연결을 해제한 후 다시 시도해주세요.",
             )
-            return {"ok": True}
+            return
 
         # ------------------------------------------------------------
         #     신규 연동 (Upsert + conflict-safe)
         # ------------------------------------------------------------
         try:
-            supabase.table("notification_channels").upsert(
-                {
-                    "user_id": user_id,
-                    "type": "telegram",
-                    "identifier": chat_id,
-                    "enabled": True,
-                },
-                on_conflict="user_id,type",
-            ).execute()
+            await asyncio.to_thread(
+                supabase.table("notification_channels")
+                .upsert(
+                    {
+                        "user_id": user_id,
+                        "type": "telegram",
+                        "identifier": chat_id,
+                        "enabled": True,
+                    },
+                    on_conflict="user_id,type",
+                )
+                .execute
+            )
         except Exception as e:
             print("❌ Supabase error (upsert):", e)
             await send_message(
                 chat_id, "⚠️ 알림 연동에 실패했습니다. 잠시 후 다시 시도해주세요."
             )
-            return {"ok": True}
+            return
 
         # 토큰 무효화 (재사용 방지)
         try:
-            supabase.table("users").update({"telegram_auth_token": None}).eq(
-                "id", user_id
-            ).execute()
+            await asyncio.to_thread(
+                supabase.table("users")
+                .update({"telegram_auth_token": None})
+                .eq("id", user_id)
+                .execute
+            )
         except Exception as e:
             print("⚠️ Warning: Could not clear token:", e)
 
@@ -190,7 +239,7 @@ async def telegram_webhook(request: Request):
             chat_id, f"✅ 텔레그램 알림이 성공적으로 연결되었습니다!\n\n계정: {email}"
         )
         print(f"✅ Telegram linked: user={email}, chat_id={chat_id}")
-        return {"ok": True}
+        return
 
     # ------------------------------------------------------------
     # 📌 기타 텍스트 메시지 처리
@@ -198,15 +247,13 @@ async def telegram_webhook(request: Request):
     await send_message(
         chat_id, "🤖 명령어를 인식하지 못했습니다. /start 로 다시 시도해주세요."
     )
-    return {"ok": True}
+    return
 
 
 async def send_message(chat_id: str, text: str):
-    """텔레그램으로 메시지 보내기"""
-    url = f"https://api.telegram.org/bot{settings.TELEGRAM_BOT_API_KEY}/sendMessage"
-    data = {"chat_id": chat_id, "text": text, "parse_mode": "Markdown"}
+    """텔레그램으로 메시지 보내기 (알림 발송기의 공유 세션 / rate limit 사용)"""
     try:
-        requests.post(url, data=data)
+        await notifier.send_telegram_message(chat_id, text)
     except Exception as e:
         print("⚠️ Telegram send_message error:", e)
 
@@ -217,27 +264,41 @@ async def send_message(chat_id: str, text: str):
 async def crawl_and_notify():
     print("🚀 크롤링 시작")
 
-    auction_repo = AuctionRepository(settings.SUPABASE_URL, settings.SUPABASE_KEY)
-    notif_repo = NotificationRepository(settings.SUPABASE_URL, settings.SUPABASE_KEY)
-    notifier = NotifierService(
-        slack_token=settings.SLACK_TOKEN, telegram_api_key=settings.TELEGRAM_BOT_API_KEY
-    )
+    # 저장소는 프로세스 전역 Supabase 커넥션 풀을 공유 (실행마다 연결을 새로 맺지 않음)
+    auction_repo = AuctionRepository(client=supabase)
+    notif_repo = NotificationRepository(client=supabase)
     crawl_log_repo = CrawlLogRepository(supabase)
-    crawl_log_service = CrawlLogService(crawl_log_repo, supabase)
-
-    crawler = CrawlerService(auction_repo)
-    notification_service = NotificationService(notif_repo, auction_repo, notifier)
+    # 지역 코드 사전은 갱신 주기가 지난 경우에만 다시 조회
+    await asyncio.to_thread(region_codes.refresh)
+    crawl_log_service = CrawlLogService(crawl_log_repo, supabase, region_codes)
+
+    # 기존 매물 스냅샷은 실행당 1회만 조회하여 전 지역이 공유
+    snapshot = await asyncio.to_thread(AuctionSnapshot.load, auction_repo)
+    # 누적 사건번호는 지난 실행 이후 추가된 매물만 증분 조회
+    await asyncio.to_thread(seen_cases.refresh, auction_repo)
+    crawler = CrawlerService(
+        auction_repo,
+        snapshot,
+        engine=crawler_engine,
+        checkpoints=crawl_checkpoints,
+        seen_cases=seen_cases,
+    )
+    # 이미지 수집은 목록 수집과 분리된 워커 풀에서 처리
+    image_pipeline = ImagePipeline(crawler)
+    notification_service = NotificationService(
+        notif_repo, auction_repo, notification_outbox, outbox_worker
+    )
 
     # ------------------------------------------------------
     # 1) DB rules 불러오기
     # ------------------------------------------------------
-    res = (
+    res = await asyncio.to_thread(
         supabase.table("notification_rules")
         .select("sido_code, sigu_code")
         .eq("enabled", True)
         .not_.is_("sido_code", None)
         .not_.is_("sigu_code", None)
-        .execute()
+        .execute
     )
 
     rules = res.data or []
@@ -286,6 +347,13 @@ async def crawl_and_notify():
             )
             continue
 
+        # ---- 4) 실제 존재하는 지역 코드인지 확인 ----
+        if not region_codes.is_valid(sido_str, sigu_str):
+            print(
+                f"⚠️ 존재하지 않는 지역 코드 → SKIP: sido={sido_str}, sigu={sigu_str}"
+            )
+            continue
+
         # 최종 유효한 경우만 추가
         detect_target.append(
             {
@@ -296,20 +364,22 @@ async def crawl_and_notify():
 
     print("📌 실제 감시 대상:", detect_target)
 
-    # -----------------------åå-------------------------------
-    # 4) 각 지역별 순차 크롤링 (IP Ban 방지)
     # ------------------------------------------------------
-    for idx, target in enumerate(detect_target):
+    # 4) 지역별 동시 크롤링 (요청 속도는 토큰 버킷으로 제한 → IP Ban 방지)
+    # ------------------------------------------------------
+    async def crawl_region(idx: int, target: dict):
         print(f"🔎 [{idx + 1}/{len(detect_target)}] 지역 조회: {target}")
 
         unit_target = [target]
 
         # 시작 로그 기록
-        log_id = crawl_log_service.start(sido_str, sigu_str)
+        log_id = await asyncio.to_thread(
+            crawl_log_service.start, target["sido_code"], target["sigu_code"]
+        )
 
         # 지역별 크롤 실행
-        raw_results, new_auctions, updated_auctions = crawler.crawl_new_auctions(
-            unit_target
+        raw_results, new_auctions, updated_auctions = (
+            await crawler.crawl_new_auctions_async(unit_target)
         )
 
         debug_save_json(
@@ -322,7 +392,9 @@ async def crawl_and_notify():
         # --- 신규 저장 ---
         if new_auctions:
             print(f"📥 지역 신규 매물 {len(new_auctions)}건 저장")
-            inserted_ids = auction_repo.insert_many(new_auctions)
+            inserted_ids = await asyncio.to_thread(
+                auction_repo.insert_many, new_auctions
+            )
             if inserted_ids and len(inserted_ids) == len(new_auctions):
                 # zip을 사용하여 ID와 경매 객체를 묶어 ID 할당
                 for auction, auction_id in zip(new_auctions, inserted_ids):
@@ -333,20 +405,74 @@ async def crawl_and_notify():
                     "⚠️ 경매 저장에는 성공했으나, 삽입된 ID를 가져오는 데 실패했습니다. 알림 처리를 건너뛸 수 있습니다."
                 )
                 # 이 경우, new_auctions에 id가 없어 알림 로그 기록이 실패할 수 있습니다.
+            # 다음 지역 중복 판정을 위해 인덱스 갱신
+            snapshot.add_many(new_auctions)
+            await asyncio.to_thread(seen_cases.add_many, new_auctions)
+
+            # 저장된 매물은 썸네일 대기 상태 → 이미지 파이프라인 완료 후 알림
+            stored = [auction for auction in new_auctions if auction.get("id")]
+            image_jobs = [await image_pipeline.submit(auction) for auction in stored]
+            thumbnails = await asyncio.gather(*image_jobs)
+            # 썸네일은 지역 단위로 모아 한 번에 반영 (저장된 전체 행이므로 병합 조회 생략)
+            thumbnailed = [a for a, url in zip(stored, thumbnails) if url]
+            if thumbnailed:
+                await asyncio.to_thread(
+                    auction_repo.upsert_many, thumbnailed, merge_existing=False
+                )
             await notification_service.process_new_auctions(new_auctions)
 
         # --- 업데이트 저장 ---
         if updated_auctions:
             print(f"♻️ 지역 업데이트 매물 {len(updated_auctions)}건 갱신")
-            for auction in updated_auctions:
-                auction_repo.update_by_id(auction, auction["id"])
+            await asyncio.to_thread(auction_repo.upsert_many, updated_auctions)
+
+        # 결과 반영이 끝난 지역만 체크포인트 기록
+        await asyncio.to_thread(crawler.commit_checkpoint, target)
 
         # 종료 로그 기록
-        crawl_log_service.finish(log_id, new_count, updated_count)
+        await asyncio.to_thread(
+            crawl_log_service.finish, log_id, new_count, updated_count
+        )
 
-        print("⏳ 다음 지역 조회 전 2분 대기...")
-        await asyncio.sleep(60)
+    # ------------------------------------------------------
+    # 5) 이전 실행에서 이미지 수집에 실패한 매물 재시도 (썸네일 NULL)
+    # ------------------------------------------------------
+    async def retry_missing_thumbnails(started_at: datetime):
+        missing = await asyncio.to_thread(
+            auction_repo.fetch_missing_thumbnails,
+            (started_at - timedelta(days=settings.IMAGE_RETRY_DAYS)).isoformat(),
+            started_at.isoformat(),
+        )
+        if not missing:
+            return
+        print(f"🖼 썸네일 누락 매물 {len(missing)}건 이미지 재수집")
+        image_jobs = [await image_pipeline.submit(auction) for auction in missing]
+        thumbnails = await asyncio.gather(*image_jobs)
+        # 조회한 전체 행에 썸네일만 채운 것이므로 병합 조회 생략
+        thumbnailed = [a for a, url in zip(missing, thumbnails) if url]
+        if thumbnailed:
+            await asyncio.to_thread(
+                auction_repo.upsert_many, thumbnailed, merge_existing=False
+            )
 
+    image_pipeline.start()
+    # 이번 실행 이전에 저장된 매물만 대상 (지역 크롤과 같은 워커 풀 공유)
+    thumbnail_retry = asyncio.create_task(retry_missing_thumbnails(datetime.now()))
+    try:
+        await RegionScheduler().run(detect_target, crawl_region)
+    finally:
+        try:
+            await thumbnail_retry
+        except Exception as e:
+            print(f"⚠️ 썸네일 재수집 실패: {e}")
+        await image_pipeline.close()
+        # 이번 실행에서 모은 묶음 알림 발송
+        await asyncio.to_thread(notification_outbox.release_digests)
+        outbox_worker.wake()
+
+    await asyncio.to_thread(get_geocode_cache().flush)
+    print(f"🗺 지오코딩 캐시: {get_geocode_cache().stats()}")
+    print(f"📮 알림 대기열: {notification_outbox.stats()}")
     print("✅ 전체 크롤링 종료")
 
 
@@ -368,6 +494,16 @@ scheduler.start()
 # --------------------------------------------------
 @app.on_event("startup")
 async def startup_event():
+    notification_log_sink.start()
+    outbox_worker.start()
     asyncio.create_task(crawl_and_notify())
     print("🚀 FastAPI server started and Telegram Webhook active.")
     print("🕓 Scheduler running every Monday and Thursday at 10:00 AM (KST).")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await outbox_worker.close()
+    await notification_log_sink.close()
+    await crawler_engine.close()
+    await notifier.close()
@@ -1,5 +1,11 @@
 from .base_repository import BaseRepository
-from typing import List, Dict
+from typing import Iterator, List, Dict, Optional
+from config.settings import settings
+
+
+def _chunks(data: List[Dict], size: int) -> Iterator[List[Dict]]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
 
 
 class AuctionRepository(BaseRepository):
@@ -12,19 +18,175 @@ class AuctionRepository(BaseRepository):
             .execute()
         ).data
 
-    def insert_many(
-        self, data: List[Dict]
-    ) -> List[str]:  # 반환 타입을 List[str]로 명시 (ID가 문자열이라 가정)
-        # Supabase 삽입 실행
-        response = self.supabase.table("auctions").insert(data).execute()
+    def fetch_snapshot_by_date_range(
+        self, start: str, end: str, columns: str, page_size: int = 1000
+    ) -> List[Dict]:
+        """필요한 컬럼만 선택하여 기간 내 매물 전체 조회 (1000건 제한 회피용 페이지 조회)"""
+        rows: List[Dict] = []
+        offset = 0
+        while True:
+            page = (
+                self.supabase.table("auctions")
+                .select(columns)
+                .gte("created_at", start)
+                .lte("created_at", end)
+                .order("id")
+                .range(offset, offset + page_size - 1)
+                .execute()
+            ).data or []
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+            offset += page_size
+
+    def fetch_case_keys_since(
+        self, created_from: Optional[str] = None, page_size: int = 1000
+    ) -> List[Dict]:
+        """
+        created_at >= created_from 인 매물의 사건번호/법원코드 조회 (전체 기간은 None)
+        누적 사건번호 인덱스의 증분 갱신용 (created_at 오름차순 페이지 조회)
+        """
+        rows: List[Dict] = []
+        offset = 0
+        while True:
+            query = self.supabase.table("auctions").select("case_id, bo_cd, created_at")
+            if created_from:
+                query = query.gte("created_at", created_from)
+            page = (
+                query.order("created_at")
+                .order("id")
+                .range(offset, offset + page_size - 1)
+                .execute()
+            ).data or []
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+            offset += page_size
+
+    def fetch_missing_thumbnails(
+        self, start: str, end: str, page_size: int = 1000
+    ) -> List[Dict]:
+        """기간 내 생성됐지만 thumbnail_src가 비어 있는 매물 전체 행 조회 (이미지 재수집용)"""
+        rows: List[Dict] = []
+        offset = 0
+        while True:
+            page = (
+                self.supabase.table("auctions")
+                .select("*")
+                .is_("thumbnail_src", None)
+                .gte("created_at", start)
+                .lte("created_at", end)
+                .order("id")
+                .range(offset, offset + page_size - 1)
+                .execute()
+            ).data or []
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+            offset += page_size
+
+    def fetch_by_case_ids(
+        self, case_ids: List[str], columns: str, chunk_size: int = 200
+    ) -> List[Dict]:
+        """사건번호 목록으로 매물 조회 (URL 길이 제한 대비 chunk 단위)"""
+        case_ids = list(dict.fromkeys(case_ids))
+        rows: List[Dict] = []
+        for i in range(0, len(case_ids), chunk_size):
+            rows.extend(
+                (
+                    self.supabase.table("auctions")
+                    .select(columns)
+                    .in_("case_id", case_ids[i : i + chunk_size])
+                    .execute()
+                ).data
+                or []
+            )
+        return rows
+
+    def insert_many(self, data: List[Dict], chunk_size: int = None) -> List[str]:
+        """신규 매물 일괄 저장 (chunk 단위) → 삽입된 ID 목록 (입력 순서 유지)"""
+        chunk_size = chunk_size or settings.DB_CHUNK_SIZE
+        inserted_ids: List[str] = []
+        for chunk in _chunks(data, chunk_size):
+            response = self.supabase.table("auctions").insert(chunk).execute()
+            # 응답 데이터에서 삽입된 레코드의 ID만 추출
+            if response and response.data:
+                inserted_ids.extend(item.get("id") for item in response.data)
+        return inserted_ids
 
-        # 🌟 개선: 응답 데이터에서 삽입된 레코드의 ID만 추출
-        if response and response.data:
-            # 삽입된 데이터 리스트에서 각 항목의 'id' 값을 추출하여 반환
-            inserted_ids = [item.get("id") for item in response.data]
-            return inserted_ids
+    def upsert_many(
+        self,
+        data: List[Dict],
+        on_conflict: str = "id",
+        chunk_size: int = None,
+        merge_existing: bool = True,
+    ) -> List[Dict]:
+        """
+        매물 일괄 갱신 (id 또는 case_id 기준 upsert, chunk 단위)
+        - 일부 컬럼만 전달된 행은 기존 행을 chunk 단위로 조회해 병합한 전체 행으로 upsert
+          (Postgres는 ON CONFLICT 판정 전에 NOT NULL 제약을 검사하므로 부분 행 upsert 불가)
+        - 전체 행을 전달하는 경우 merge_existing=False 로 조회 생략
+        - chunk 실패 시 해당 chunk만 행 단위 update로 재시도 (실패한 행은 기록 후 계속)
+        """
+        chunk_size = chunk_size or settings.DB_CHUNK_SIZE
+        updated: List[Dict] = []
+        for chunk in _chunks(data, chunk_size):
+            try:
+                rows = (
+                    self._merge_existing(chunk, on_conflict)
+                    if merge_existing
+                    else chunk
+                )
+                if not rows:
+                    continue
+                response = (
+                    self.supabase.table("auctions")
+                    .upsert(rows, on_conflict=on_conflict, default_to_null=False)
+                    .execute()
+                )
+                updated.extend(response.data or [])
+            except Exception as e:
+                print(
+                    f"⚠️ 일괄 갱신 실패 → 행 단위 갱신으로 재시도 ({len(chunk)}건): {e}"
+                )
+                for row in chunk:
+                    try:
+                        response = (
+                            self.supabase.table("auctions")
+                            .update(row)
+                            .eq(on_conflict, row[on_conflict])
+                            .execute()
+                        )
+                        updated.extend(response.data or [])
+                    except Exception as e:
+                        print(
+                            f"❗ 매물 갱신 실패 ({on_conflict}={row.get(on_conflict)}): {e}"
+                        )
+        return updated
 
-        return []
+    def _merge_existing(
+        self, chunk: List[Dict], on_conflict: str, lookup_size: int = 200
+    ) -> List[Dict]:
+        """기존 전체 행 + 변경 컬럼 병합 (DB에 없는 행은 제외, 조회는 URL 길이 제한 대비 chunk 단위)"""
+        keys = list(dict.fromkeys(row[on_conflict] for row in chunk))
+        existing: Dict = {}
+        for i in range(0, len(keys), lookup_size):
+            for row in (
+                self.supabase.table("auctions")
+                .select("*")
+                .in_(on_conflict, keys[i : i + lookup_size])
+                .execute()
+            ).data or []:
+                existing[row[on_conflict]] = row
+        merged: Dict = {}
+        for row in chunk:
+            key = row[on_conflict]
+            if key in existing:
+                # 같은 chunk 내 동일 키는 마지막 변경까지 누적
+                merged[key] = {**merged.get(key, existing[key]), **row}
+            else:
+                print(f"⚠️ 갱신 대상 매물 없음 → SKIP ({on_conflict}={key})")
+        return list(merged.values())
 
     def update_by_id(self, data: Dict, id: str):
         return self.supabase.table("auctions").update(data).eq("id", id).execute()
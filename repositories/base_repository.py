@@ -1,6 +1,16 @@
-from supabase import create_client, Client
+from typing import Optional
+
+from supabase import Client
+
+from core.supabase import get_supabase_client
 
 
 class BaseRepository:
-    def __init__(self, url: str, key: str):
-        self.supabase: Client = create_client(url, key)
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        key: Optional[str] = None,
+        client: Optional[Client] = None,
+    ):
+        # 저장소마다 Client를 만들지 않고 프로세스 전역 커넥션 풀을 공유
+        self.supabase: Client = client or get_supabase_client(url, key)
@@ -22,6 +22,29 @@ class NotificationRepository(BaseRepository):
             .execute()
         ).data
 
+    def get_channels_by_users(
+        self, user_ids: List[str], chunk_size: int = 200
+    ) -> List[Dict]:
+        """여러 유저의 활성 알림 채널 일괄 조회 (URL 길이 제한 대비 chunk 단위)"""
+        user_ids = list(user_ids)
+        channels: List[Dict] = []
+        for i in range(0, len(user_ids), chunk_size):
+            channels.extend(
+                (
+                    self.supabase.table("notification_channels")
+                    .select("*")
+                    .in_("user_id", user_ids[i : i + chunk_size])
+                    .eq("enabled", True)
+                    .execute()
+                ).data
+                or []
+            )
+        return channels
+
     def insert_notification_log(self, log_data: Dict):
         """발송 기록 저장"""
         return self.supabase.table("notifications_log").insert(log_data).execute()
+
+    def insert_notification_logs(self, logs: List[Dict]):
+        """발송 기록 일괄 저장"""
+        return self.supabase.table("notifications_log").insert(logs).execute()
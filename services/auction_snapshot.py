@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+
+from repositories.auction_repository import AuctionRepository
+from utils.auction_index import AuctionIndex
+
+# 중복 판정/업데이트 감지에 필요한 컬럼만 조회
+SNAPSHOT_COLUMNS = (
+    "id, case_id, bo_cd, failed_auction_count, minimum_price, status, "
+    "sido_code, sigu_code"
+)
+SNAPSHOT_FIELDS = [c.strip() for c in SNAPSHOT_COLUMNS.split(",")]
+
+
+class AuctionSnapshot:
+    """
+    크롤 실행 단위 기존 매물 스냅샷.
+    실행 시작 시 1회 조회하여 모든 지역이 공유하며,
+    지역별 필터링은 메모리에서 처리합니다.
+    """
+
+    def __init__(self, rows: Iterable[Dict]):
+        self.index = AuctionIndex()
+        self._by_region: Dict[Tuple[str, str], List[Dict]] = {}
+        self.add_many(rows)
+
+    @classmethod
+    def load(cls, repo: AuctionRepository, days: int = 15) -> "AuctionSnapshot":
+        """최근 N일 내 생성된 매물 스냅샷 로드"""
+        today = datetime.now()
+        start_iso = (today - timedelta(days=days)).isoformat()
+        rows = repo.fetch_snapshot_by_date_range(
+            start_iso, today.isoformat(), SNAPSHOT_COLUMNS
+        )
+        snapshot = cls(rows)
+        print(f"🗂 기존 매물 스냅샷 로드: {len(snapshot)}건")
+        return snapshot
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def add_many(self, auctions: Iterable[Dict]):
+        """신규 저장된 매물을 스냅샷에 반영 (필요 컬럼만 보관)"""
+        for auction in auctions:
+            row = {field: auction.get(field) for field in SNAPSHOT_FIELDS}
+            self.index.add(row)
+            region = (str(row.get("sido_code")), str(row.get("sigu_code")))
+            self._by_region.setdefault(region, []).append(row)
+
+    def for_region(self, sido_code: str, sigu_code: str) -> List[Dict]:
+        """시도/시군구 코드로 스냅샷 필터링"""
+        return self._by_region.get((str(sido_code), str(sigu_code)), [])
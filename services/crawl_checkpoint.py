@@ -0,0 +1,123 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from config.settings import settings
+
+
+def fingerprint(items: Iterable[Dict], total_cnt: Optional[int] = None) -> str:
+    """
+    검색 결과 지문 (순서 무관)
+    사건번호/법원/유찰횟수/최저가/매각기일이 같으면 같은 결과로 판단
+    """
+    keys = sorted(
+        "|".join(
+            str(item.get(field) or "")
+            for field in (
+                "srnSaNo",
+                "boCd",
+                "yuchalCnt",
+                "notifyMinmaePrice1",
+                "maeGiil",
+            )
+        )
+        for item in items
+    )
+    digest = hashlib.sha1()
+    if total_cnt is not None:
+        digest.update(f"total={total_cnt}\n".encode())
+    for key in keys:
+        digest.update(key.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class CrawlCheckpointStore:
+    """
+    지역별 크롤 체크포인트 (SQLite).
+    - probe: 전체 건수 + 첫/마지막 페이지 지문 → 같으면 나머지 페이지 조회 생략
+    - fingerprint: 마지막 전체 결과 지문, 페이지 수, 마지막 크롤/전체 동기화 시각
+      (전체 동기화 시 probe 는 같은데 fingerprint 가 달라졌으면 놓친 변경으로 기록)
+    - CRAWL_FULL_RESYNC_HOURS 마다 체크포인트와 무관하게 전체 동기화
+      → 중간 페이지만 바뀐 경우 최대 이 시간만큼 늦게 반영됨
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.CRAWL_CHECKPOINT_PATH
+        self._lock = threading.Lock()
+
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS crawl_checkpoint (
+                sido_code TEXT NOT NULL,
+                sigu_code TEXT NOT NULL,
+                probe TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                total_cnt INTEGER NOT NULL,
+                page_count INTEGER NOT NULL,
+                last_crawl_at REAL NOT NULL,
+                last_full_at REAL NOT NULL,
+                PRIMARY KEY (sido_code, sigu_code)
+            )
+            """)
+        self._conn.commit()
+
+    def get(self, sido_code: str, sigu_code: str) -> Optional[Dict]:
+        with self._lock:
+            self._conn.row_factory = sqlite3.Row
+            row = self._conn.execute(
+                "SELECT * FROM crawl_checkpoint WHERE sido_code = ? AND sigu_code = ?",
+                (sido_code, sigu_code),
+            ).fetchone()
+            self._conn.row_factory = None
+        return dict(row) if row else None
+
+    @staticmethod
+    def can_skip(checkpoint: Optional[Dict], probe: str) -> bool:
+        """첫/마지막 페이지 지문이 같고 전체 동기화 주기가 지나지 않았으면 True"""
+        if checkpoint is None or checkpoint["probe"] != probe:
+            return False
+        resync_seconds = settings.CRAWL_FULL_RESYNC_HOURS * 60 * 60
+        return time.time() - checkpoint["last_full_at"] < resync_seconds
+
+    def touch(self, sido_code: str, sigu_code: str):
+        """변경 없이 건너뛴 지역의 마지막 크롤 시각만 갱신"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE crawl_checkpoint SET last_crawl_at = ? "
+                "WHERE sido_code = ? AND sigu_code = ?",
+                (time.time(), sido_code, sigu_code),
+            )
+            self._conn.commit()
+
+    def save(
+        self,
+        sido_code: str,
+        sigu_code: str,
+        probe: str,
+        fingerprint: str,
+        total_cnt: int,
+        page_count: int,
+    ):
+        """전체 결과를 반영한 뒤 체크포인트 저장"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO crawl_checkpoint VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    sido_code,
+                    sigu_code,
+                    probe,
+                    fingerprint,
+                    total_cnt,
+                    page_count,
+                    now,
+                    now,
+                ),
+            )
+            self._conn.commit()
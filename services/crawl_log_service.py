@@ -1,33 +1,26 @@
 # services/crawl_log_service.py
 from core.supabase import supabase
 from repositories.crawl_log_repository import CrawlLogRepository
+from services.region_code_service import RegionCodeService
 
 
 class CrawlLogService:
-    def __init__(self, repo: CrawlLogRepository, supabase: supabase):
+    def __init__(
+        self,
+        repo: CrawlLogRepository,
+        supabase: supabase,
+        region_codes: RegionCodeService = None,
+    ):
         self.repo = repo
         self.supabase = supabase
+        # 코드 → 이름은 메모리 사전에서 조회 (지역마다 DB 조회하지 않음)
+        self.region_codes = region_codes or RegionCodeService(supabase)
 
     def get_sido_name(self, sido_code: str):
-        res = (
-            self.supabase.table("sido_code")
-            .select("sido_name")
-            .eq("sido_code", sido_code)
-            .maybe_single()
-            .execute()
-        )
-        return res.data["sido_name"] if res.data else None
+        return self.region_codes.sido_name(sido_code)
 
     def get_sigu_name(self, sigu_code: str):
-        print(sigu_code)
-        res = (
-            self.supabase.table("sigu_code")
-            .select("sigu_name")
-            .eq("sigu_code", sigu_code)
-            .maybe_single()
-            .execute()
-        )
-        return res.data["sigu_name"] if res.data else None
+        return self.region_codes.sigu_name(sigu_code)
 
     def start(self, sido_code: str, sigu_code: str) -> int:
         print(sido_code)
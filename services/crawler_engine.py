@@ -0,0 +1,106 @@
+import asyncio
+import aiohttp
+from typing import Any, Dict, Optional, Tuple
+
+from config.settings import settings
+from utils.http_recorder import record_response
+from utils.rate_limiter import TokenBucket, backoff_delay
+
+# 재시도 대상 상태 코드 (요청 과다 / 서버 오류)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CrawlerEngine:
+    """
+    법원경매 사이트 요청용 비동기 HTTP 엔진.
+    하나의 aiohttp 세션(커넥션 풀)을 공유하여 keep-alive / TLS 연결을 재사용하고,
+    호스트별 동시 연결 수를 제한합니다.
+
+    모든 요청은 토큰 버킷(초당 요청 수)을 통과하며,
+    429/5xx 응답은 jitter가 적용된 지수 백오프로 재시도합니다.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        timeout: Optional[float] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_retries: Optional[int] = None,
+    ):
+        self.limit = limit or settings.CRAWL_HTTP_LIMIT
+        self.limit_per_host = limit_per_host or settings.CRAWL_HTTP_LIMIT_PER_HOST
+        self.timeout = timeout or settings.CRAWL_HTTP_TIMEOUT
+        self.rate_limiter = rate_limiter or TokenBucket(
+            settings.CRAWL_RATE_PER_SEC, settings.CRAWL_RATE_BURST
+        )
+        self.max_retries = (
+            settings.CRAWL_MAX_RETRIES if max_retries is None else max_retries
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "CrawlerEngine":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """공유 세션 (최초 사용 시 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def post_json(
+        self, url: str, payload: Dict, headers: Optional[Dict] = None
+    ) -> Tuple[int, Optional[Any]]:
+        """JSON POST 요청 → (HTTP 상태코드, 응답 JSON 또는 None)"""
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            retry_after = None
+            try:
+                async with self.session.post(
+                    url, json=payload, headers=headers
+                ) as resp:
+                    status = resp.status
+                    if status == 200:
+                        # 법원경매 사이트는 JSON 응답에도 text/html 헤더를 주는 경우가 있음
+                        data = await resp.json(content_type=None)
+                        record_response(url, payload, status, data)
+                        return status, data
+                    if status not in RETRY_STATUSES or attempt >= self.max_retries:
+                        return status, None
+                    retry_after = resp.headers.get("Retry-After")
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                status = type(e).__name__
+
+            delay = backoff_delay(
+                attempt, settings.CRAWL_BACKOFF_BASE, settings.CRAWL_BACKOFF_MAX
+            )
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            if status == 429:
+                # 서버가 속도 제한을 알린 경우 전체 요청을 잠시 멈춤
+                self.rate_limiter.pause(delay)
+            attempt += 1
+            print(
+                f"⏳ {status} → {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})"
+            )
+            await asyncio.sleep(delay)
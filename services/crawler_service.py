@@ -1,14 +1,20 @@
-import os
 import re
-import base64
-import requests
+import math
+import asyncio
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional
+from typing import AsyncIterator, Coroutine, List, Dict, Tuple, Optional
+from config.settings import settings
 from repositories.auction_repository import AuctionRepository
-from utils.env_utils import is_oracle_instance
 from utils.date_utils import convert_yyyymmdd_to_dotted
-from utils.naver_utils import get_coordinates
 from utils.address_utils import build_full_address
+from utils.auction_index import AuctionIndex
+from services.auction_snapshot import SNAPSHOT_COLUMNS, AuctionSnapshot
+from services.crawler_engine import CrawlerEngine
+from services.geocoding_service import GeocodingService
+from services.image_store import ImageStore, get_image_store
+from services.seen_case_index import SeenCaseIndex
+from services.crawl_checkpoint import CrawlCheckpointStore, fingerprint
 
 
 class CrawlerService:
@@ -16,31 +22,105 @@ class CrawlerService:
     법원경매 사이트에서 매물 정보를 크롤링하는 서비스.
     기존 main.py 크롤링 로직을 재구성하여
     new_auctions, updated_auctions 리스트를 반환합니다.
+
+    모든 요청은 CrawlerEngine(aiohttp 공유 세션)으로 처리하며,
+    기존 동기 메서드(crawl_new_auctions, extract_image_list)는 호환용 래퍼입니다.
     """
 
-    def __init__(self, auction_repo: AuctionRepository):
+    def __init__(
+        self,
+        auction_repo: AuctionRepository,
+        snapshot: Optional[AuctionSnapshot] = None,
+        engine: Optional[CrawlerEngine] = None,
+        geocoder: Optional[GeocodingService] = None,
+        checkpoints: Optional[CrawlCheckpointStore] = None,
+        image_store: Optional[ImageStore] = None,
+        seen_cases: Optional[SeenCaseIndex] = None,
+    ):
         self.repo = auction_repo
+        # 크롤 실행 단위 기존 매물 스냅샷 (없으면 최초 크롤 시 1회 로드)
+        self.snapshot = snapshot
+        self.engine = engine or CrawlerEngine()
+        self.geocoder = geocoder or GeocodingService(self.engine)
+        self.image_store = image_store or get_image_store()
+        # 전체 기간 사건번호 인덱스 (스냅샷 기간 밖 기존 매물 판별용)
+        self.seen_cases = seen_cases
+        # 증분 크롤 체크포인트 (None 이면 매번 전체 조회)
+        self.checkpoints = checkpoints
+        # 지역 결과 반영(DB 저장) 후 commit_checkpoint()로 기록할 체크포인트
+        self._pending_checkpoints: Dict[Tuple[str, str], Dict] = {}
+
+    def _run_sync(self, coro: Coroutine):
+        """동기 호출 호환용: 별도 이벤트 루프에서 실행 후 세션 정리"""
+
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.engine.close()
+
+        return asyncio.run(runner())
 
     # ---------------------------
     # 🔹 Helper Functions
     # ---------------------------
 
+    def load_snapshot(self) -> AuctionSnapshot:
+        """기존 매물 스냅샷 (실행당 1회 로드)"""
+        if self.snapshot is None:
+            self.snapshot = AuctionSnapshot.load(self.repo)
+        return self.snapshot
+
+    async def save_images(
+        self,
+        images: List[Dict],
+        case_id: Optional[str] = None,
+        court_code: Optional[str] = None,
+    ) -> Optional[str]:
+        """사건의 모든 사진 저장 후 대표 사진(pageSeq=1) 공개 URL 반환"""
+        manifest = await asyncio.to_thread(
+            self.image_store.save_case_images, images, case_id, court_code
+        )
+        return self.image_store.representative_url(manifest)
+
+    async def ensure_images(
+        self, case_id: str, court_code: str, sido_code: str, sigu_code: str
+    ) -> Optional[str]:
+        """
+        대표 사진 URL 확보
+        로컬에 이미 저장된 사건((법원코드, 사건번호) 일치)은 이미지 목록 요청 없이 기존 파일 사용
+        """
+        manifest = await asyncio.to_thread(self.image_store.lookup, case_id, court_code)
+        if manifest is not None:
+            return self.image_store.representative_url(manifest)
+
+        images = await self.fetch_image_list(case_id, court_code, sido_code, sigu_code)
+        if not images:
+            return None
+        return await self.save_images(images, case_id, court_code)
+
     def compare_case_id_duplicated(
-        self, data: List[Dict], case_id: str
+        self, index: AuctionIndex, case_id: str, bo_cd: Optional[str] = None
     ) -> Tuple[bool, Optional[Dict]]:
-        """사건번호 중복 확인"""
-        for item in data:
-            if item["case_id"] == case_id:
-                return True, item
-        return False, None
+        """사건번호 중복 확인 (O(1) 인덱스 조회)"""
+        item = index.get(case_id, bo_cd)
+        return item is not None, item
 
     def extract_image_list(
         self, case_id: str, court_code: str, sido_code: str, sigu_code: str
     ):
+        """법원경매 물건 이미지 목록 조회 (동기 호환 래퍼)"""
+        return self._run_sync(
+            self.fetch_image_list(case_id, court_code, sido_code, sigu_code)
+        )
+
+    async def fetch_image_list(
+        self, case_id: str, court_code: str, sido_code: str, sigu_code: str
+    ) -> List[Dict]:
         """
         법원경매 물건 이미지 목록 조회
         """
-        url = "https://www.courtauction.go.kr/pgj/pgj15B/selectAuctnCsSrchRslt.on"
+        url = f"{settings.COURTAUCTION_BASE_URL}{self.IMAGE_LIST_PATH}"
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Referer": "https://www.courtauction.go.kr/",
@@ -118,10 +198,9 @@ class CrawlerService:
         }
 
         try:
-            response = requests.post(url, json=data, headers=headers)
-            if response.status_code == 200:
-                response_data = response.json()
-                data = response_data.get("data", {})
+            status, response_data = await self.engine.post_json(url, data, headers)
+            if status == 200:
+                data = (response_data or {}).get("data", {})
                 if (
                     data
                     and "dma_result" in data
@@ -132,149 +211,315 @@ class CrawlerService:
                     print(f"⚠️ 이미지 없음: {case_id}")
                     return []
             else:
-                print(f"❌ 이미지 요청 실패: {response.status_code}")
+                print(f"❌ 이미지 요청 실패: {status}")
                 return []
         except Exception as e:
             print(f"❗ 이미지 추출 중 오류 ({case_id}): {e}")
             return []
 
+    # ---------------------------
+    # 🔸 Search (Pagination)
+    # ---------------------------
+
+    # 기본 주소는 settings.COURTAUCTION_BASE_URL (stand-in 서버로 변경 가능)
+    SEARCH_PATH = "/pgj/pgjsearch/searchControllerMain.on"
+    IMAGE_LIST_PATH = "/pgj/pgj15B/selectAuctnCsSrchRslt.on"
+    SEARCH_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Referer": "https://www.courtauction.go.kr/",
+        "Content-Type": "application/json; charset=UTF-8",
+        "Accept": "application/json, text/javascript, */*; q=0.01",
+        "X-Requested-With": "XMLHttpRequest",
+    }
+
+    def build_search_payload(
+        self,
+        target: Dict,
+        bid_start: str,
+        bid_end: str,
+        page_no: int = 1,
+        page_size: int = 50,
+    ) -> Dict:
+        """매각기일 검색 요청 본문 생성"""
+        return {
+            "dma_pageInfo": {
+                "pageNo": page_no,
+                "pageSize": page_size,
+                "bfPageNo": "",
+                "startRowNo": "",
+                "totalCnt": "",
+                "totalYn": "Y",
+                "groupTotalCount": "",
+            },
+            "dma_srchGdsDtlSrchInfo": {
+                "rletDspslSpcCondCd": "",
+                "bidDvsCd": "000331",
+                "mvprpRletDvsCd": "00031R",
+                "cortAuctnSrchCondCd": "0004601",
+                "rprsAdongSdCd": target["sido_code"],
+                "rprsAdongSggCd": target["sigu_code"],
+                "rprsAdongEmdCd": "",
+                "rdnmSdCd": "",
+                "rdnmSggCd": "",
+                "rdnmNo": "",
+                "mvprpDspslPlcAdongSdCd": "",
+                "mvprpDspslPlcAdongSggCd": "",
+                "mvprpDspslPlcAdongEmdCd": "",
+                "rdDspslPlcAdongSdCd": "",
+                "rdDspslPlcAdongSggCd": "",
+                "rdDspslPlcAdongEmdCd": "",
+                "cortOfcCd": "B000210",
+                "jdbnCd": "",
+                "execrOfcDvsCd": "",
+                "lclDspslGdsLstUsgCd": "20000",
+                "mclDspslGdsLstUsgCd": "20100",
+                "sclDspslGdsLstUsgCd": "20104",
+                "cortAuctnMbrsId": "",
+                "aeeEvlAmtMin": "",
+                "aeeEvlAmtMax": "",
+                "lwsDspslPrcRateMin": "",
+                "lwsDspslPrcRateMax": "",
+                "flbdNcntMin": "",
+                "flbdNcntMax": "",
+                "objctArDtsMin": "",
+                "objctArDtsMax": "",
+                "mvprpArtclKndCd": "",
+                "mvprpArtclNm": "",
+                "mvprpAtchmPlcTypCd": "",
+                "notifyLoc": "on",
+                "lafjOrderBy": "",
+                "pgmId": "PGJ151F01",
+                "csNo": "",
+                "cortStDvs": "2",
+                "statNum": 1,
+                "bidBgngYmd": bid_start,
+                "bidEndYmd": bid_end,
+                "dspslDxdyYmd": "",
+                "fstDspslHm": "",
+                "scndDspslHm": "",
+                "thrdDspslHm": "",
+                "fothDspslHm": "",
+                "dspslPlcNm": "",
+                "lwsDspslPrcMin": "",
+                "lwsDspslPrcMax": "",
+                "grbxTypCd": "",
+                "gdsVendNm": "",
+                "fuelKndCd": "",
+                "carMdyrMax": "",
+                "carMdyrMin": "",
+                "carMdlNm": "",
+            },
+        }
+
+    async def fetch_search_page(
+        self,
+        target: Dict,
+        bid_start: str,
+        bid_end: str,
+        page_no: int,
+        page_size: int,
+    ) -> Tuple[List[Dict], int]:
+        """검색 결과 1페이지 조회 → (결과 목록, 전체 건수)"""
+        data = self.build_search_payload(target, bid_start, bid_end, page_no, page_size)
+        status, response_data = await self.engine.post_json(
+            f"{settings.COURTAUCTION_BASE_URL}{self.SEARCH_PATH}",
+            data,
+            self.SEARCH_HEADERS,
+        )
+        if status != 200:
+            raise RuntimeError(f"검색 요청 실패 (page {page_no}): {status}")
+
+        json_data = (response_data or {}).get("data") or {}
+        results = json_data.get("dlt_srchResult") or []
+        page_info = json_data.get("dma_pageInfo") or {}
+        try:
+            total_cnt = int(page_info.get("totalCnt") or 0)
+        except (TypeError, ValueError):
+            total_cnt = 0
+        return results, max(total_cnt, len(results))
+
+    async def aiter_search_results(
+        self,
+        target: Dict,
+        bid_start: str,
+        bid_end: str,
+        page_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        first_page: Optional[Tuple[List[Dict], int]] = None,
+        prefetched: Optional[Dict[int, Tuple[List[Dict], int]]] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        지역 검색 결과 전체 페이지 순회 (async generator)
+        - 첫 페이지 응답의 totalCnt로 전체 페이지 수 계산
+        - max_concurrency > 1 이면 나머지 페이지를 동시에 요청 (페이지 순서 유지)
+        - first_page: 이미 조회한 첫 페이지 (결과, 전체 건수) → 재요청하지 않음
+        - prefetched: 이미 조회한 나머지 페이지 {페이지 번호: (결과, 전체 건수)}
+        """
+        prefetched = prefetched or {}
+        page_size = page_size or settings.CRAWL_PAGE_SIZE
+        max_concurrency = max(1, max_concurrency or settings.CRAWL_PAGE_CONCURRENCY)
+
+        if first_page is None:
+            first_page = await self.fetch_search_page(
+                target, bid_start, bid_end, 1, page_size
+            )
+        first_results, total_cnt = first_page
+        for item in first_results:
+            yield item
+
+        total_pages = math.ceil(total_cnt / page_size)
+        if total_pages <= 1:
+            return
+        print(
+            f"📄 전체 {total_cnt}건 / {total_pages}페이지 (sido: {target['sido_code']}, sigu: {target['sigu_code']})"
+        )
+
+        # 동시 요청 수를 max_concurrency로 제한하며 페이지 순서대로 반환
+        pending = deque()
+        try:
+            for page_no in range(2, total_pages + 1):
+                if page_no in prefetched:
+                    task = asyncio.get_running_loop().create_future()
+                    task.set_result(prefetched[page_no])
+                else:
+                    task = asyncio.create_task(
+                        self.fetch_search_page(
+                            target, bid_start, bid_end, page_no, page_size
+                        )
+                    )
+                pending.append(task)
+                if len(pending) >= max_concurrency:
+                    results, _ = await pending.popleft()
+                    for item in results:
+                        yield item
+            while pending:
+                results, _ = await pending.popleft()
+                for item in results:
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def load_seen_cases(self, snapshot: AuctionSnapshot, items: List[Dict]):
+        """
+        스냅샷에 없지만 이전에 저장된 적 있는 사건은 DB에서 조회하여 스냅샷에 반영
+        → 신규 처리(이미지/지오코딩/저장/알림) 대신 기존 매물 업데이트로 처리
+        """
+        if self.seen_cases is None:
+            return
+        case_ids = [
+            item["srnSaNo"]
+            for item in items
+            if snapshot.index.get(item["srnSaNo"], item.get("boCd")) is None
+            and self.seen_cases.contains(item["srnSaNo"], item.get("boCd"))
+        ]
+        if not case_ids:
+            return
+        rows = await asyncio.to_thread(
+            self.repo.fetch_by_case_ids, case_ids, SNAPSHOT_COLUMNS
+        )
+        snapshot.add_many(rows)
+        print(f"🗃 스냅샷 기간 밖 기존 매물 {len(rows)}건 확인")
+
+    def commit_checkpoint(self, target: Dict):
+        """지역 결과를 DB에 반영한 뒤 호출 → 다음 실행부터 변경 없으면 건너뜀"""
+        key = (target["sido_code"], target["sigu_code"])
+        checkpoint = self._pending_checkpoints.pop(key, None)
+        if checkpoint is None or self.checkpoints is None:
+            return
+        self.checkpoints.save(*key, **checkpoint)
+
     # ---------------------------
     # 🔸 Main Crawler
     # ---------------------------
 
     def crawl_new_auctions(
         self, detect_target: List[Dict]
-    ) -> Tuple[List[Dict], List[Dict]]:
+    ) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """법원경매 사이트에서 신규 및 갱신 매물 수집 (동기 호환 래퍼)"""
+        return self._run_sync(self.crawl_new_auctions_async(detect_target))
+
+    async def crawl_new_auctions_async(
+        self, detect_target: List[Dict]
+    ) -> Tuple[List[Dict], List[Dict], List[Dict]]:
         """법원경매 사이트에서 신규 및 갱신 매물 수집"""
         raw_results = []
         today = datetime.now()
-        start_date = today - timedelta(days=15)
         end_date = today + timedelta(days=15)
+        bid_start = today.strftime("%Y%m%d")
+        bid_end = end_date.strftime("%Y%m%d")
 
-        today_iso = today.isoformat()
-        start_iso = start_date.isoformat()
-
-        # supabase 기존 데이터 로드
-        exist_data = self.repo.fetch_by_date_range(start_iso, today_iso)
+        # supabase 기존 데이터 인덱스 (실행당 1회 로드, 전 지역 공유)
+        snapshot = await asyncio.to_thread(self.load_snapshot)
+        index = snapshot.index
 
         new_auctions: List[Dict] = []
         updated_auctions: List[Dict] = []
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Referer": "https://www.courtauction.go.kr/",
-            "Content-Type": "application/json; charset=UTF-8",
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-            "X-Requested-With": "XMLHttpRequest",
-        }
-
-        url = "https://www.courtauction.go.kr/pgj/pgjsearch/searchControllerMain.on"
-
+        page_size = settings.CRAWL_PAGE_SIZE
         for target in detect_target:
-            start_date_str = today.strftime("%Y%m%d")
-            end_date_str = end_date.strftime("%Y%m%d")
-
-            data = {
-                "dma_pageInfo": {
-                    "pageNo": 1,
-                    "pageSize": 50,
-                    "bfPageNo": "",
-                    "startRowNo": "",
-                    "totalCnt": "",
-                    "totalYn": "Y",
-                    "groupTotalCount": "",
-                },
-                "dma_srchGdsDtlSrchInfo": {
-                    "rletDspslSpcCondCd": "",
-                    "bidDvsCd": "000331",
-                    "mvprpRletDvsCd": "00031R",
-                    "cortAuctnSrchCondCd": "0004601",
-                    "rprsAdongSdCd": target["sido_code"],
-                    "rprsAdongSggCd": target["sigu_code"],
-                    "rprsAdongEmdCd": "",
-                    "rdnmSdCd": "",
-                    "rdnmSggCd": "",
-                    "rdnmNo": "",
-                    "mvprpDspslPlcAdongSdCd": "",
-                    "mvprpDspslPlcAdongSggCd": "",
-                    "mvprpDspslPlcAdongEmdCd": "",
-                    "rdDspslPlcAdongSdCd": "",
-                    "rdDspslPlcAdongSggCd": "",
-                    "rdDspslPlcAdongEmdCd": "",
-                    "cortOfcCd": "B000210",
-                    "jdbnCd": "",
-                    "execrOfcDvsCd": "",
-                    "lclDspslGdsLstUsgCd": "20000",
-                    "mclDspslGdsLstUsgCd": "20100",
-                    "sclDspslGdsLstUsgCd": "20104",
-                    "cortAuctnMbrsId": "",
-                    "aeeEvlAmtMin": "",
-                    "aeeEvlAmtMax": "",
-                    "lwsDspslPrcRateMin": "",
-                    "lwsDspslPrcRateMax": "",
-                    "flbdNcntMin": "",
-                    "flbdNcntMax": "",
-                    "objctArDtsMin": "",
-                    "objctArDtsMax": "",
-                    "mvprpArtclKndCd": "",
-                    "mvprpArtclNm": "",
-                    "mvprpAtchmPlcTypCd": "",
-                    "notifyLoc": "on",
-                    "lafjOrderBy": "",
-                    "pgmId": "PGJ151F01",
-                    "csNo": "",
-                    "cortStDvs": "2",
-                    "statNum": 1,
-                    "bidBgngYmd": start_date_str,
-                    "bidEndYmd": end_date_str,
-                    "dspslDxdyYmd": "",
-                    "fstDspslHm": "",
-                    "scndDspslHm": "",
-                    "thrdDspslHm": "",
-                    "fothDspslHm": "",
-                    "dspslPlcNm": "",
-                    "lwsDspslPrcMin": "",
-                    "lwsDspslPrcMax": "",
-                    "grbxTypCd": "",
-                    "gdsVendNm": "",
-                    "fuelKndCd": "",
-                    "carMdyrMax": "",
-                    "carMdyrMin": "",
-                    "carMdlNm": "",
-                },
-            }
-
+            region_key = (target["sido_code"], target["sigu_code"])
+            search_count = 0
+            region_new: List[Tuple[Dict, str]] = []
+            region_items: List[Dict] = []
+            first_page = None
+            prefetched: Dict[int, Tuple[List[Dict], int]] = {}
+            previous = None
+            completed = False
             try:
-                response = requests.post(
-                    url,
-                    json=data,
-                    headers=headers,
-                )
-                if response.status_code != 200:
-                    print(f"❌ 요청 실패: {response.status_code}")
-                    continue
-
-                json_data = response.json()
-                search_results = json_data.get("data", {}).get("dlt_srchResult", [])
-                raw_results.extend(
-                    [
-                        {
-                            **item,
-                            "sido_code": target["sido_code"],
-                            "sigu_code": target["sigu_code"],
-                        }
-                        for item in search_results
-                    ]
-                )
-                print(
-                    f"📑 {len(search_results)}건 검색됨 (sido: {target['sido_code']}, sigu: {target['sigu_code']})"
-                )
+                if self.checkpoints is not None:
+                    # 증분 모드: 첫/마지막 페이지 지문이 지난 실행과 같으면 지역 전체 생략
+                    first_page = await self.fetch_search_page(
+                        target, bid_start, bid_end, 1, page_size
+                    )
+                    probe_items = list(first_page[0])
+                    last_page_no = math.ceil(first_page[1] / page_size)
+                    if last_page_no > 1:
+                        # 마지막 페이지는 전체 조회 시 재사용
+                        prefetched[last_page_no] = await self.fetch_search_page(
+                            target, bid_start, bid_end, last_page_no, page_size
+                        )
+                        probe_items.extend(prefetched[last_page_no][0])
+                    probe = fingerprint(probe_items, first_page[1])
+                    previous = await asyncio.to_thread(
+                        self.checkpoints.get, *region_key
+                    )
+                    if self.checkpoints.can_skip(previous, probe):
+                        await asyncio.to_thread(self.checkpoints.touch, *region_key)
+                        print(
+                            f"⏭ 변경 없음 → SKIP (sido: {target['sido_code']}, sigu: {target['sigu_code']})"
+                        )
+                        continue
+
+                region_items = [
+                    item
+                    async for item in self.aiter_search_results(
+                        target,
+                        bid_start,
+                        bid_end,
+                        page_size,
+                        first_page=first_page,
+                        prefetched=prefetched,
+                    )
+                ]
+                await self.load_seen_cases(snapshot, region_items)
+
+                for item in region_items:
+                    search_count += 1
+                    # 원본 결과는 디버그 저장용으로만 보관
+                    if settings.DEBUG:
+                        raw_results.append(
+                            {
+                                **item,
+                                "sido_code": target["sido_code"],
+                                "sigu_code": target["sigu_code"],
+                            }
+                        )
 
-                for item in search_results:
                     case_id = item["srnSaNo"]
                     failed_count = int(item.get("yuchalCnt", 0))
                     is_exist, existing_item = self.compare_case_id_duplicated(
-                        exist_data, case_id
+                        index, case_id, item.get("boCd")
                     )
 
                     status = "신건"
@@ -283,48 +528,12 @@ class CrawlerService:
 
                     # 신규 매물
                     if not is_exist:
-                        images = self.extract_image_list(
-                            case_id,
-                            item["boCd"],
-                            target["sido_code"],
-                            target["sigu_code"],
-                        )
-                        if not images:
-                            continue
-
-                        # 대표 이미지 찾기
-                        image = next(
-                            (img for img in images if img.get("pageSeq") == "1"),
-                            images[0],
-                        )
-                        image_data = base64.b64decode(image["picFile"])
-
-                        # 이미지 저장
-                        save_dir = (
-                            f"/var/www/images/auctions/{image['csNo']}"
-                            if is_oracle_instance()
-                            else f"./images/auctions/{image['csNo']}"
-                        )
-                        os.makedirs(save_dir, exist_ok=True)
-
-                        file_path = os.path.join(
-                            save_dir, f"{image['cortAuctnPicSeq']}.jpg"
-                        )
-                        file_url = f"http://oracle.artchive.in/images/auctions/{image['csNo']}/{image['cortAuctnPicSeq']}.jpg"
-
-                        with open(file_path, "wb") as f:
-                            f.write(image_data)
-
+                        # 이미지는 ImagePipeline에서 별도 처리 (저장 후 thumbnail_src 갱신)
                         area = re.search(r"(\d+\.\d+)", item.get("pjbBuldList", ""))
                         area_value = area.group(1) if area else None
 
                         auction_date = convert_yyyymmdd_to_dotted(item["maeGiil"])
 
-                        full_addr = build_full_address(item)
-                        longitude, latitude, jibun_address, road_address = (
-                            get_coordinates(full_addr)
-                        )
-
                         auction = {
                             "court": item.get("jiwonNm"),
                             "case_id": case_id,
@@ -339,7 +548,7 @@ class CrawlerService:
                             "auction_date": auction_date,
                             "sido_code": target["sido_code"],
                             "sigu_code": target["sigu_code"],
-                            "thumbnail_src": file_url,
+                            "thumbnail_src": None,
                             "rd1_nm": item.get("rd1Nm"),
                             "rd2_nm": item.get("rd2Nm"),
                             "rd_eub_myun": item.get("rdEubMyun"),
@@ -356,14 +565,16 @@ class CrawlerService:
                             "docid": item.get("docid"),
                             "sa_no": item.get("saNo"),
                             "bo_cd": item.get("boCd"),
-                            "latitude": latitude,
-                            "longitude": longitude,
-                            "jibun_address": jibun_address,
-                            "road_address": road_address,
+                            # 좌표는 지역 단위 일괄 지오코딩 후 채움
+                            "latitude": None,
+                            "longitude": None,
+                            "jibun_address": None,
+                            "road_address": None,
                             "created_at": datetime.now().isoformat(),
                             "updated_at": datetime.now().isoformat(),
                         }
                         new_auctions.append(auction)
+                        region_new.append((auction, build_full_address(item)))
 
                     # ✅ 기존 매물 업데이트
                     else:
@@ -379,10 +590,57 @@ class CrawlerService:
                                     "updated_at": datetime.now().isoformat(),
                                 }
                             )
+                            # 인덱스도 함께 갱신 (같은 실행 내 중복 업데이트 방지)
+                            existing_item.update(
+                                minimum_price=item["notifyMinmaePrice1"],
+                                status=status,
+                                failed_auction_count=failed_count,
+                            )
+                completed = True
 
             except Exception as e:
                 print(f"❗ 크롤링 중 오류: {e}")
 
+            # 전체 페이지를 정상 조회한 경우만 체크포인트 후보로 보관
+            if completed and first_page is not None:
+                full_fingerprint = fingerprint(region_items)
+                if (
+                    previous
+                    and previous["probe"] == probe
+                    and previous["fingerprint"] != full_fingerprint
+                ):
+                    # 첫/마지막 페이지로는 감지하지 못한 중간 페이지 변경 (전체 동기화로 반영)
+                    print(
+                        f"⚠️ 증분 확인에서 놓친 변경 반영 (sido: {target['sido_code']}, sigu: {target['sigu_code']})"
+                    )
+                self._pending_checkpoints[region_key] = {
+                    "probe": probe,
+                    "fingerprint": full_fingerprint,
+                    "total_cnt": first_page[1],
+                    "page_count": math.ceil(first_page[1] / page_size),
+                }
+
+            # 지역 신규 매물 주소를 한 번에 지오코딩 (중복 제거 + QPS 제한)
+            if region_new:
+                coordinates = await self.geocoder.geocode_many(
+                    [address for _, address in region_new]
+                )
+                for auction, address in region_new:
+                    longitude, latitude, jibun_address, road_address = coordinates.get(
+                        address
+                    ) or (None, None, None, None)
+                    auction.update(
+                        longitude=longitude,
+                        latitude=latitude,
+                        jibun_address=jibun_address,
+                        road_address=road_address,
+                    )
+
+            print(
+                f"📑 {search_count}건 검색됨 (sido: {target['sido_code']}, sigu: {target['sigu_code']}, "
+                f"기존: {len(snapshot.for_region(target['sido_code'], target['sigu_code']))}건)"
+            )
+
         print(
             f"✅ 신규 {len(new_auctions)}건, 업데이트 {len(updated_auctions)}건 감지됨"
         )
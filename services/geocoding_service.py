@@ -0,0 +1,88 @@
+import asyncio
+from typing import Dict, Iterable, Optional, Tuple
+
+from config.settings import settings
+from services.crawler_engine import CrawlerEngine
+from utils.geocode_cache import MISS, GeocodeCache, get_geocode_cache
+from utils.naver_utils import (
+    EMPTY_RESULT,
+    geocode_headers,
+    parse_geocode_response,
+)
+from utils.rate_limiter import TokenBucket
+
+
+class GeocodingService:
+    """
+    네이버 지오코딩 일괄 처리 서비스.
+    주소 묶음을 받아 중복 제거 → 캐시 조회 → 나머지를 QPS 제한 하에 동시 요청하고
+    주소별 결과를 반환합니다. (HTTP 커넥션 풀은 CrawlerEngine 세션을 공유)
+    """
+
+    def __init__(
+        self,
+        engine: CrawlerEngine,
+        qps: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        cache: Optional[GeocodeCache] = None,
+    ):
+        self.engine = engine
+        qps = qps or settings.GEOCODE_QPS
+        self.rate_limiter = TokenBucket(qps, qps)
+        self.concurrency = max(1, concurrency or settings.GEOCODE_CONCURRENCY)
+        self.cache = cache
+
+    async def geocode_many(self, addresses: Iterable[str]) -> Dict[str, Tuple]:
+        """주소 목록 → {주소: (경도, 위도, 지번주소, 도로명주소)}"""
+        cache = self.cache or get_geocode_cache()
+        unique = list(dict.fromkeys(a for a in addresses if a))
+        # SQLite 캐시 조회/저장은 지역당 1회씩 스레드에서 일괄 처리
+        cached = await asyncio.to_thread(cache.get_many, unique)
+        results: Dict[str, Tuple] = {}
+        pending = []
+
+        for address in unique:
+            if cached[address] is MISS:
+                pending.append(address)
+            else:
+                results[address] = cached[address] or EMPTY_RESULT
+
+        if pending:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            resolved: Dict[str, Optional[Tuple]] = {}
+
+            async def resolve(address: str):
+                async with semaphore:
+                    result = await self._geocode(address)
+                if result is MISS:
+                    results[address] = EMPTY_RESULT
+                    return
+                # 찾을 수 없는 주소(None)도 negative cache로 저장
+                resolved[address] = result
+                results[address] = result or EMPTY_RESULT
+
+            await asyncio.gather(*(resolve(address) for address in pending))
+            if resolved:
+                await asyncio.to_thread(cache.set_many, resolved)
+            print(
+                f"🗺 지오코딩 {len(results)}건 (요청 {len(pending)}건, 캐시 {len(results) - len(pending)}건)"
+            )
+
+        return results
+
+    async def _geocode(self, address: str):
+        """네이버 응답 → 결과 튜플 / None (주소 없음) / MISS (요청 실패, 캐시 안 함)"""
+        await self.rate_limiter.acquire()
+        try:
+            async with self.engine.session.get(
+                settings.NAVER_GEOCODE_URL,
+                params={"query": address},
+                headers=geocode_headers(),
+            ) as resp:
+                resp.raise_for_status()
+                data = await resp.json(content_type=None)
+        except Exception as e:
+            print(f"❗ 네이버 지도 API 오류 ({address}): {e}")
+            return MISS
+
+        return parse_geocode_response(data)
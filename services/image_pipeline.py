@@ -0,0 +1,102 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config.settings import settings
+from services.crawler_service import CrawlerService
+
+
+class ImagePipeline:
+    """
+    매물 이미지 수집 파이프라인.
+    목록 수집과 분리된 (case_id, court_code) 작업 큐를 워커 풀이 병렬 처리하며,
+    이미지 저장이 끝나면 매물 dict의 thumbnail_src를 채웁니다.
+    (DB 반영은 호출 측에서 지역 단위로 모아 일괄 upsert)
+    """
+
+    def __init__(
+        self,
+        crawler: CrawlerService,
+        workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ):
+        self.crawler = crawler
+        self.workers = max(1, workers or settings.IMAGE_WORKERS)
+        self.queue: asyncio.Queue = asyncio.Queue(
+            maxsize=queue_size or settings.IMAGE_QUEUE_SIZE
+        )
+        self._tasks: List[asyncio.Task] = []
+        self._started_at: Optional[float] = None
+        self.completed = 0
+        self.failed = 0
+
+    # ---------------------------
+    # 🔹 Lifecycle
+    # ---------------------------
+
+    def start(self):
+        if self._tasks:
+            return
+        self._started_at = time.monotonic()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def close(self):
+        """남은 작업 처리 후 워커 종료"""
+        await self.queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        print(
+            f"🖼 이미지 파이프라인 종료: 성공 {self.completed}건, 실패 {self.failed}건, "
+            f"{self.images_per_second:.2f} images/s"
+        )
+
+    @property
+    def images_per_second(self) -> float:
+        if not self._started_at:
+            return 0.0
+        elapsed = time.monotonic() - self._started_at
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    # ---------------------------
+    # 🔹 Jobs
+    # ---------------------------
+
+    async def submit(self, auction: Dict) -> asyncio.Future:
+        """저장된 매물의 이미지 작업 등록 → 완료 시 thumbnail_src가 담긴 Future"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((auction, future))
+        return future
+
+    async def _worker(self):
+        while True:
+            auction, future = await self.queue.get()
+            try:
+                file_url = await self._process(auction)
+                if not future.done():
+                    future.set_result(file_url)
+            except Exception as e:
+                self.failed += 1
+                print(f"❗ 이미지 처리 오류 ({auction.get('case_id')}): {e}")
+                if not future.done():
+                    future.set_result(None)
+            finally:
+                self.queue.task_done()
+
+    async def _process(self, auction: Dict) -> Optional[str]:
+        # 로컬에 저장된 사건은 요청 생략, 없으면 모든 사진 저장 후 대표 사진 URL
+        file_url = await self.crawler.ensure_images(
+            auction["case_id"],
+            auction["bo_cd"],
+            auction["sido_code"],
+            auction["sigu_code"],
+        )
+        if not file_url:
+            return None
+
+        auction["thumbnail_src"] = file_url
+        auction["updated_at"] = datetime.now().isoformat()
+        self.completed += 1
+        return file_url
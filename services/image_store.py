@@ -0,0 +1,341 @@
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import settings
+from utils.env_utils import is_oracle_instance
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow 미설치 시 원본만 저장
+    Image = None
+
+PUBLIC_BASE_URL = "http://oracle.artchive.in/images/auctions"
+
+# base64 디코딩 단위 (4의 배수 → 조각 단위로 정확히 디코딩)
+DECODE_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = re.compile(r"\s+")
+
+
+def default_image_root() -> str:
+    return "/var/www/images/auctions" if is_oracle_instance() else "./images/auctions"
+
+
+class ImageStore:
+    """
+    매물 이미지 저장소.
+    - csPicLst의 모든 사진을 저장 ({root}/{법원코드}/{csNo}/{cortAuctnPicSeq}.jpg)
+    - base64를 조각 단위로 디코딩하며 임시 파일에 기록 → 완료 후 교체
+    - 내용 해시(sha256)가 같은 사진은 다시 쓰지 않음
+    - 사진별 축소 이미지(thumb / preview)를 저장 시 1회 생성 (Pillow)
+    - 사건별 manifest.json에 저장 내역 기록
+    - 로컬 인덱스((법원코드, 사건번호) → manifest)로 이미 저장된 사건은 이미지 요청 생략
+      (사건번호는 사건 종류까지 포함한 전체 값, 법원코드가 없는 과거 사건은 매칭하지 않음)
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, root: Optional[str] = None, base_url: str = PUBLIC_BASE_URL):
+        self.root = root or default_image_root()
+        self.base_url = base_url.rstrip("/")
+        self.written = 0
+        self.deduplicated = 0
+        # (법원코드, 사건번호) → manifest (최초 조회 시 이미지 디렉토리를 1회 스캔)
+        self._index: Optional[Dict[Tuple[str, str], Dict]] = None
+        self._index_lock = threading.Lock()
+
+    # ---------------------------
+    # 🔹 Paths / Manifest
+    # ---------------------------
+
+    @staticmethod
+    def _case_path(cs_no: str, court_code: Optional[str]) -> List[str]:
+        # 같은 csNo가 법원마다 있을 수 있으므로 법원코드 아래에 저장
+        return [court_code, cs_no] if court_code else [cs_no]
+
+    def case_dir(self, cs_no: str, court_code: Optional[str] = None) -> str:
+        return os.path.join(self.root, *self._case_path(cs_no, court_code))
+
+    def url_for(
+        self, cs_no: str, file_name: str, court_code: Optional[str] = None
+    ) -> str:
+        return "/".join([self.base_url, *self._case_path(cs_no, court_code), file_name])
+
+    def load_manifest(
+        self, cs_no: str, court_code: Optional[str] = None
+    ) -> Optional[Dict]:
+        return self._read_manifest(self.case_dir(cs_no, court_code))
+
+    def _read_manifest(self, case_dir: str) -> Optional[Dict]:
+        path = os.path.join(case_dir, self.MANIFEST_NAME)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self, manifest: Dict):
+        path = os.path.join(
+            self.case_dir(manifest["case_id"], manifest.get("court_code")),
+            self.MANIFEST_NAME,
+        )
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    # ---------------------------
+    # 🔹 Save
+    # ---------------------------
+
+    @staticmethod
+    def _decode_to_file(encoded: str, fileobj=None) -> Tuple[str, int]:
+        """
+        base64 문자열을 조각 단위로 디코딩 → (sha256, 크기)
+        fileobj 가 없으면 기록 없이 해시만 계산
+        """
+        digest = hashlib.sha256()
+        size = 0
+        pending = ""
+        for start in range(0, len(encoded), DECODE_CHUNK_SIZE):
+            pending += _WHITESPACE.sub("", encoded[start : start + DECODE_CHUNK_SIZE])
+            usable = len(pending) - len(pending) % 4
+            if not usable:
+                continue
+            data = base64.b64decode(pending[:usable])
+            pending = pending[usable:]
+            digest.update(data)
+            size += len(data)
+            if fileobj is not None:
+                fileobj.write(data)
+        if pending:
+            data = base64.b64decode(pending)
+            digest.update(data)
+            size += len(data)
+            if fileobj is not None:
+                fileobj.write(data)
+        return digest.hexdigest(), size
+
+    def _save_picture(self, save_dir: str, file_name: str, encoded: str, known: Dict):
+        """
+        사진 1장 저장 → (sha256, 크기, 새로 기록 여부)
+        known: 같은 사건의 기존 파일명 → sha256
+        기존 해시가 있으면 먼저 해시만 계산하여 같으면 디스크에 쓰지 않음
+        """
+        target = os.path.join(save_dir, file_name)
+        if known.get(file_name) and os.path.exists(target):
+            sha256, size = self._decode_to_file(encoded)
+            if known[file_name] == sha256:
+                self.deduplicated += 1
+                return sha256, size, False
+
+        fd, tmp_path = tempfile.mkstemp(dir=save_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                sha256, size = self._decode_to_file(encoded, f)
+
+            os.replace(tmp_path, target)
+            tmp_path = None
+            self.written += 1
+            return sha256, size, True
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    # ---------------------------
+    # 🔹 Local Index
+    # ---------------------------
+
+    def _scan(self) -> Dict[Tuple[str, str], Dict]:
+        """
+        이미지 디렉토리 스캔 → (법원코드, 사건번호)별 manifest
+        법원코드가 기록되지 않은 과거 사건({root}/{csNo})은 다른 법원·사건 종류와
+        구분할 수 없으므로 인덱스에 넣지 않음 (다시 요청하여 법원코드 아래에 저장)
+        """
+        index: Dict[Tuple[str, str], Dict] = {}
+        try:
+            top_dirs = [entry for entry in os.scandir(self.root) if entry.is_dir()]
+        except FileNotFoundError:
+            return index
+
+        for top in top_dirs:
+            # 법원코드 디렉토리 아래의 사건 디렉토리만 확인
+            if self._read_manifest(top.path) is not None:
+                continue
+            for entry in os.scandir(top.path):
+                if entry.is_dir():
+                    manifest = self._read_manifest(entry.path)
+                    if manifest is not None:
+                        self._add_to_index(index, manifest)
+        return index
+
+    @staticmethod
+    def _key(case_no: Optional[str], court_code: Optional[str]):
+        """인덱스 키 (법원코드, 사건번호) → 둘 중 하나라도 없으면 None"""
+        case_no = _WHITESPACE.sub("", str(case_no or ""))
+        if not case_no or not court_code:
+            return None
+        return str(court_code), case_no
+
+    @classmethod
+    def _add_to_index(cls, index: Dict[Tuple[str, str], Dict], manifest: Dict):
+        # 검색 결과의 사건번호(srnSaNo)와 이미지 응답의 csNo 형식이 다르므로 둘 다 등록
+        for case_no in (manifest["case_id"], manifest.get("source_case_id")):
+            key = cls._key(case_no, manifest.get("court_code"))
+            if key:
+                index[key] = manifest
+
+    def lookup(self, case_id: str, court_code: Optional[str]) -> Optional[Dict]:
+        """
+        이미 저장된 사건의 manifest (없으면 None, 동기 → to_thread 권장)
+        법원코드를 모르면 항상 None (다른 법원의 같은 번호 사건과 혼동 방지)
+        """
+        key = self._key(case_id, court_code)
+        if key is None:
+            return None
+        with self._index_lock:
+            if self._index is None:
+                self._index = self._scan()
+            return self._index.get(key)
+
+    def save_case_images(
+        self,
+        images: List[Dict],
+        case_id: Optional[str] = None,
+        court_code: Optional[str] = None,
+    ) -> Dict:
+        """
+        사건의 모든 사진 저장 (동기 → asyncio.to_thread로 호출) → manifest
+        대표 사진은 pageSeq=1 (없으면 첫 번째)
+        case_id / court_code: 이미지 목록을 요청한 사건번호와 법원코드(boCd = cortOfcCd)
+        (로컬 인덱스 키로 함께 기록)
+        """
+        cs_no = images[0]["csNo"]
+        court_code = court_code or images[0].get("cortOfcCd")
+        save_dir = self.case_dir(cs_no, court_code)
+        os.makedirs(save_dir, exist_ok=True)
+
+        previous = self.load_manifest(cs_no, court_code) or {}
+        known = {
+            entry["file"]: entry.get("sha256") for entry in previous.get("images", [])
+        }
+
+        entries = []
+        for image in images:
+            if not image.get("picFile"):
+                continue
+            file_name = f"{image['cortAuctnPicSeq']}.jpg"
+            sha256, size, written = self._save_picture(
+                save_dir, file_name, image["picFile"], known
+            )
+            variants = self._make_variants(save_dir, file_name, force=written)
+            entries.append(
+                {
+                    "seq": str(image["cortAuctnPicSeq"]),
+                    "page_seq": str(image.get("pageSeq") or ""),
+                    "file": file_name,
+                    "sha256": sha256,
+                    "size": size,
+                    "variants": variants,
+                }
+            )
+
+        if not entries:
+            return {}
+
+        representative = next(
+            (e for e in entries if e["page_seq"] == "1"),
+            entries[0],
+        )
+        manifest = {
+            "case_id": cs_no,
+            "source_case_id": case_id,
+            "court_code": court_code,
+            "representative": representative["file"],
+            "images": entries,
+            "updated_at": datetime.now().isoformat(),
+        }
+        self._write_manifest(manifest)
+        with self._index_lock:
+            if self._index is not None:
+                self._add_to_index(self._index, manifest)
+        return manifest
+
+    # ---------------------------
+    # 🔹 Variants
+    # ---------------------------
+
+    @staticmethod
+    def variant_sizes() -> Dict[str, int]:
+        return {
+            "preview": settings.IMAGE_PREVIEW_SIZE,
+            "thumb": settings.IMAGE_THUMBNAIL_SIZE,
+        }
+
+    def _make_variants(self, save_dir: str, file_name: str, force: bool) -> Dict:
+        """
+        축소 이미지 생성 → {"thumb": 파일명, "preview": 파일명}
+        원본이 바뀐 경우(force)에만 다시 생성, Pillow가 없으면 생략
+        """
+        if Image is None:
+            return {}
+
+        base = os.path.splitext(file_name)[0]
+        sizes = self.variant_sizes()
+        variants = {name: f"{base}_{name}.jpg" for name in sizes}
+        missing = [
+            name
+            for name, variant in variants.items()
+            if force or not os.path.exists(os.path.join(save_dir, variant))
+        ]
+        if not missing:
+            return variants
+
+        try:
+            with Image.open(os.path.join(save_dir, file_name)) as img:
+                # JPEG는 가장 큰 변형 크기에 맞춰 축소 디코딩 (전체 해상도 디코딩 생략)
+                largest = max(sizes[name] for name in missing)
+                img.draft("RGB", (largest, largest))
+                img = img.convert("RGB")
+                for name in sorted(missing, key=sizes.get, reverse=True):
+                    img.thumbnail((sizes[name], sizes[name]))
+                    path = os.path.join(save_dir, variants[name])
+                    tmp_path = f"{path}.part"
+                    img.save(
+                        tmp_path,
+                        "JPEG",
+                        quality=settings.IMAGE_VARIANT_QUALITY,
+                        optimize=True,
+                        progressive=True,
+                    )
+                    os.replace(tmp_path, path)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 축소 이미지 생성 실패 ({file_name}): {e}")
+            return {}
+        return variants
+
+    def representative_url(
+        self, manifest: Dict, variant: Optional[str] = "thumb"
+    ) -> Optional[str]:
+        """대표 사진 URL (축소 이미지가 있으면 해당 변형, 없으면 원본)"""
+        if not manifest or not manifest.get("representative"):
+            return None
+        file_name = manifest["representative"]
+        entry = next(
+            (e for e in manifest.get("images", []) if e["file"] == file_name), {}
+        )
+        file_name = (entry.get("variants") or {}).get(variant) or file_name
+        return self.url_for(manifest["case_id"], file_name, manifest.get("court_code"))
+
+
+@lru_cache
+def get_image_store() -> ImageStore:
+    """프로세스 전역 이미지 저장소 (로컬 인덱스를 실행 간 공유)"""
+    return ImageStore()
@@ -0,0 +1,131 @@
+from typing import Dict, Tuple
+
+# Telegram Markdown(legacy) 에서 서식으로 해석되는 문자
+TELEGRAM_MARKDOWN_SPECIALS = ("\\", "_", "*", "`", "[")
+
+
+def escape_telegram_markdown(text: str) -> str:
+    for ch in TELEGRAM_MARKDOWN_SPECIALS:
+        text = text.replace(ch, f"\\{ch}")
+    return text
+
+
+def escape_slack_mrkdwn(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+ESCAPERS = {
+    "telegram": escape_telegram_markdown,
+    "slack": escape_slack_mrkdwn,
+}
+
+
+def truncate_lines(text: str, limit: int) -> str:
+    """
+    limit 이내의 마지막 줄바꿈에서 자름
+    (서식/이스케이프는 줄 단위로 닫히므로 줄 중간에서 잘려 400 오류가 나지 않음)
+    """
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit + 1)
+    if cut > 0:
+        return text[:cut]
+    # 첫 줄부터 넘치는 경우: 공백에서 자르고 끝에 남은 이스케이프 문자 제거
+    cut = text.rfind(" ", 0, limit + 1)
+    return text[: cut if cut > 0 else limit].rstrip("\\")
+
+
+def format_price(value) -> str:
+    """금액 단위 변환 (만원 단위 이하 무시)"""
+    try:
+        price = int(float(value or 0))
+    except ValueError:
+        price = 0
+
+    if price >= 100_000_000:  # 억 단위 포함
+        eok = price // 100_000_000
+        man = (price % 100_000_000) // 10_000
+        return f"{eok}억 {man:,}만원" if man > 0 else f"{eok}억"
+    if price >= 10_000:  # 만원 단위만 있는 경우
+        man = price // 10_000
+        return f"{man:,}만원"
+    return "가격 정보 없음"
+
+
+class MessageRenderer:
+    """
+    알림 메시지 렌더러.
+    - 매물 고유 부분(가격/면적/주소 등)은 매물당 한 번만 포맷
+    - 채널 종류별 이스케이프 결과와 완성된 메시지를 캐시
+      → 규칙/채널이 늘어나도 포맷 비용은 일정
+    """
+
+    def __init__(self):
+        self._parts: Dict[Tuple, Dict[str, str]] = {}
+        self._messages: Dict[Tuple, str] = {}
+
+    @staticmethod
+    def _auction_key(auction: Dict):
+        return auction.get("id") or auction.get("case_id") or id(auction)
+
+    def _auction_parts(self, auction: Dict, channel_type: str) -> Dict[str, str]:
+        key = (self._auction_key(auction), channel_type)
+        parts = self._parts.get(key)
+        if parts is None:
+            escape = ESCAPERS.get(channel_type, str)
+            parts = {
+                "category": escape(str(auction.get("category") or "분류 없음")),
+                "address": escape(str(auction.get("address") or "주소 정보 없음")),
+                "area": escape(
+                    f"{auction.get('area')}㎡"
+                    if auction.get("area")
+                    else "면적 정보 없음"
+                ),
+                "price": format_price(auction.get("minimum_price")),
+                "date": escape(str(auction.get("auction_date") or "미정")),
+                # URL은 링크 문법 안에 들어가므로 이스케이프하지 않음 (없으면 링크 줄 생략)
+                "thumbnail": auction.get("thumbnail_src") or "",
+            }
+            self._parts[key] = parts
+        return parts
+
+    def render(self, auction: Dict, rule: Dict, channel_type: str = "telegram") -> str:
+        """(매물, 규칙, 채널 종류) 단위로 완성된 메시지 (캐시)"""
+        key = (self._auction_key(auction), rule.get("id"), channel_type)
+        message = self._messages.get(key)
+        if message is not None:
+            return message
+
+        parts = self._auction_parts(auction, channel_type)
+        escape = ESCAPERS.get(channel_type, str)
+        rule_name = escape(str(rule.get("name") or "-"))
+
+        if channel_type == "telegram":
+            message = (
+                f"📢 *새 매물 알림!*\n"
+                f"━━━━━━━━━━━━━━━\n"
+                f"🏷 *규칙:* {rule_name}\n"
+                f"🏠 *종류:* {parts['category']}\n"
+                f"📍 *주소:* {parts['address']}\n"
+                f"📏 *면적:* {parts['area']}\n"
+                f"💰 *최저가:* {parts['price']}\n"
+                f"🗓 *매각기일:* {parts['date']}\n"
+                f"━━━━━━━━━━━━━━━"
+            )
+            if parts["thumbnail"]:
+                message += f"\n🔗 [매물 이미지 보기]({parts['thumbnail']})"
+        else:
+            message = (
+                f":rotating_light: *새 매물 알림!*\n"
+                f"> *알림명:* {rule_name}\n"
+                f"> *종류:* {parts['category']}\n"
+                f"> *주소:* {parts['address']}\n"
+                f"> *면적:* {parts['area']}\n"
+                f"> *최저가:* {parts['price']}\n"
+                f"> *매각기일:* {parts['date']}"
+            )
+            if parts["thumbnail"]:
+                message += f"\n> <{parts['thumbnail']}|이미지 보기>"
+
+        self._messages[key] = message
+        return message
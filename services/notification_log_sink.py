@@ -0,0 +1,106 @@
+import asyncio
+from typing import Dict, List, Optional
+
+from config.settings import settings
+from utils.rate_limiter import backoff_delay
+
+
+class NotificationLogSink:
+    """
+    notifications_log 버퍼 기록기.
+    발송 로그를 메모리에 모았다가 건수(batch_size) 또는 주기(flush_interval)마다
+    일괄 insert 하며, 실패한 batch는 백오프 후 재시도합니다.
+    기록이 실패한 뒤에는 add()에서 바로 flush하지 않고 주기 flush로만 재시도하며
+    (발송 경로 지연 방지), 버퍼가 max_buffer를 넘으면 오래된 로그부터 폐기합니다.
+    종료 시 close()로 남은 로그를 모두 기록합니다.
+    """
+
+    def __init__(
+        self,
+        notif_repo,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        max_buffer: Optional[int] = None,
+    ):
+        self.repo = notif_repo
+        self.batch_size = batch_size or settings.NOTIFY_LOG_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.NOTIFY_LOG_FLUSH_INTERVAL
+        self.max_retries = (
+            settings.NOTIFY_LOG_MAX_RETRIES if max_retries is None else max_retries
+        )
+        self.max_buffer = max_buffer or settings.NOTIFY_LOG_BUFFER_MAX
+        self._buffer: List[Dict] = []
+        self._healthy = True  # 직전 flush 성공 여부
+        self.dropped = 0
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+
+    def start(self):
+        """주기적 flush 시작"""
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._flush_periodically())
+
+    async def close(self):
+        """주기 flush 중단 후 남은 로그 기록"""
+        if self._timer is not None:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+        await self.flush()
+        if self._buffer:
+            print(f"❌ 알림 로그 {len(self._buffer)}건 기록 실패 (폐기)")
+            self._buffer.clear()
+        if self.dropped:
+            print(f"❌ 버퍼 초과로 폐기된 알림 로그: {self.dropped}건")
+
+    async def add(self, row: Dict):
+        self._buffer.append(row)
+        self._trim()
+        # 직전 기록이 실패했다면 재시도는 주기 flush에 맡김 (진행 중인 flush가 있으면 그쪽이 처리)
+        if (
+            self._healthy
+            and not self._lock.locked()
+            and len(self._buffer) >= self.batch_size
+        ):
+            await self.flush()
+
+    async def flush(self):
+        async with self._lock:
+            while self._buffer:
+                # 기록 중 add()의 폐기와 겹치지 않도록 batch를 버퍼에서 꺼내 기록
+                batch = self._buffer[: self.batch_size]
+                del self._buffer[: len(batch)]
+                if not await self._write(batch):
+                    # 버퍼 앞으로 되돌리고 다음 주기 flush에서 다시 시도
+                    self._buffer[:0] = batch
+                    self._trim()
+                    self._healthy = False
+                    return
+            self._healthy = True
+
+    def _trim(self):
+        """버퍼가 max_buffer를 넘으면 오래된 로그부터 폐기"""
+        overflow = len(self._buffer) - self.max_buffer
+        if overflow <= 0:
+            return
+        del self._buffer[:overflow]
+        if not self.dropped:
+            print(f"⚠️ 알림 로그 버퍼 초과({self.max_buffer}건) → 오래된 로그부터 폐기")
+        self.dropped += overflow
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def _write(self, batch: List[Dict]) -> bool:
+        for attempt in range(self.max_retries + 1):
+            try:
+                await asyncio.to_thread(self.repo.insert_notification_logs, batch)
+                return True
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    print(f"❗ 알림 로그 일괄 기록 실패 ({len(batch)}건): {e}")
+                    return False
+                await asyncio.sleep(backoff_delay(attempt))
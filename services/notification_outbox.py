@@ -0,0 +1,319 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config.settings import settings
+
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+DEAD = "dead"
+
+
+class NotificationOutbox:
+    """
+    발송 대기 알림 영구 큐 (SQLite).
+    - (rule_id, auction_id, channel_id) 멱등 키로 중복 적재 방지
+    - 실패 시 지수 백오프로 재시도, 최대 횟수 초과 시 dead 처리
+    - 재시작 시 발송 중이던 항목은 대기 상태로 복구 (at-least-once)
+    - 묶음(digest) 항목은 NOTIFY_DIGEST_WINDOW 동안 모았다가 함께 발송
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.OUTBOX_PATH
+        self._lock = threading.Lock()
+
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                idempotency_key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(outbox)")}
+        if "digest" not in columns:
+            self._conn.execute(
+                "ALTER TABLE outbox ADD COLUMN digest INTEGER NOT NULL DEFAULT 0"
+            )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_outbox_due "
+            "ON outbox (status, next_attempt_at)"
+        )
+        # 이전 프로세스가 발송 도중 종료된 항목 복구
+        self._conn.execute(
+            "UPDATE outbox SET status = ? WHERE status = ?", (PENDING, SENDING)
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(entry: Dict) -> str:
+        # 매물 ID를 받지 못한 경우 사건번호로 대체
+        auction_key = entry.get("auction_id") or entry.get("case_id")
+        return f"{entry['rule_id']}:{auction_key}:{entry['channel_id']}"
+
+    def enqueue(self, entries: List[Dict]) -> int:
+        """
+        발송 항목 적재 → 새로 추가된 건수
+        entries: [{"rule_id", "auction_id", "channel_id", "type", "identifier", "text", ...}]
+        """
+        now = time.time()
+        rows = [
+            (
+                self.make_key(e),
+                json.dumps(e, ensure_ascii=False),
+                PENDING,
+                # 묶음 발송 항목은 일정 시간 모아서 발송
+                now + settings.NOTIFY_DIGEST_WINDOW if e.get("digest") else now,
+                1 if e.get("digest") else 0,
+                now,
+                now,
+            )
+            for e in entries
+        ]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO outbox "
+                "(idempotency_key, payload, status, next_attempt_at, digest, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+            return self._conn.total_changes - before
+
+    def claim_due(self, limit: int) -> List[Dict]:
+        """발송 시각이 된 항목을 가져와 발송 중 상태로 변경"""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT idempotency_key, payload, attempts FROM outbox "
+                "WHERE status = ? AND next_attempt_at <= ? "
+                "ORDER BY next_attempt_at LIMIT ?",
+                (PENDING, now, limit),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE outbox SET status = ?, updated_at = ? WHERE idempotency_key = ?",
+                [(SENDING, now, key) for key, _, _ in rows],
+            )
+            self._conn.commit()
+
+        return [
+            {**json.loads(payload), "_key": key, "_attempts": attempts}
+            for key, payload, attempts in rows
+        ]
+
+    def release_digests(self):
+        """모으는 중인 묶음 항목을 즉시 발송 가능 상태로 (크롤 실행 종료 시)"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET next_attempt_at = ? "
+                "WHERE status = ? AND digest = 1 AND attempts = 0",
+                (time.time(), PENDING),
+            )
+            self._conn.commit()
+
+    def mark_sent(self, keys: List[str]):
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE outbox SET status = ?, updated_at = ? WHERE idempotency_key = ?",
+                [(SENT, now, key) for key in keys],
+            )
+            self._conn.commit()
+
+    def mark_failed(self, key: str, attempts: int, error: str = None):
+        """실패 처리 → 백오프 후 재시도 또는 dead letter"""
+        now = time.time()
+        attempts += 1
+        if attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            status, next_attempt_at = DEAD, now
+            print(f"☠️ 알림 발송 포기 (dead letter): {key}")
+        else:
+            status = PENDING
+            next_attempt_at = now + min(
+                settings.OUTBOX_BACKOFF_MAX,
+                settings.OUTBOX_BACKOFF_BASE * (2 ** (attempts - 1)),
+            )
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, "
+                "last_error = ?, updated_at = ? WHERE idempotency_key = ?",
+                (status, attempts, next_attempt_at, error, now, key),
+            )
+            self._conn.commit()
+
+    def prune(self, retention_days: Optional[float] = None):
+        """보관 기간이 지난 발송 완료 항목 정리 (멱등 키 유지 기간)"""
+        days = retention_days or settings.OUTBOX_RETENTION_DAYS
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM outbox WHERE status = ? AND updated_at < ?",
+                (SENT, time.time() - days * 24 * 60 * 60),
+            )
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM outbox GROUP BY status"
+            ).fetchall()
+        return dict(rows)
+
+
+class OutboxWorker:
+    """
+    Outbox 발송 워커.
+    매칭(적재)과 별도로 자체 속도로 대기 항목을 발송하고,
+    성공 건은 발송 로그에 기록합니다.
+    """
+
+    def __init__(
+        self,
+        outbox: NotificationOutbox,
+        notifier,
+        log_sink,
+        batch_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        self.outbox = outbox
+        self.notifier = notifier
+        self.log_sink = log_sink
+        self.batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+        self.poll_interval = poll_interval or settings.OUTBOX_POLL_INTERVAL
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def wake(self):
+        """새 항목 적재 시 대기 없이 바로 발송"""
+        self._wake.set()
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        await asyncio.to_thread(self.outbox.prune)
+        while True:
+            try:
+                if await self.drain_once():
+                    continue
+            except Exception as e:
+                print(f"❗ 알림 발송 워커 오류: {e}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def _send(self, entries: List[Dict]) -> List[bool]:
+        """
+        개별 항목은 각각, 묶음 항목은 목적지별로 최대 NOTIFY_DIGEST_MAX_ITEMS건씩
+        한 메시지로 발송 → 항목별 성공 여부 (입력 순서 유지)
+        묶음은 항목이 담긴 메시지 단위로 성공 여부를 받아, 실패한 항목만 재시도
+        """
+        singles, groups = [], {}
+        for idx, entry in enumerate(entries):
+            if entry.get("digest"):
+                groups.setdefault((entry["type"], entry["identifier"]), []).append(idx)
+            else:
+                singles.append(idx)
+
+        max_items = settings.NOTIFY_DIGEST_MAX_ITEMS
+        chunks = [
+            indexes[i : i + max_items]
+            for indexes in groups.values()
+            for i in range(0, len(indexes), max_items)
+        ]
+
+        single_results, *digest_results = await asyncio.gather(
+            self.notifier.send_many([entries[i] for i in singles]),
+            *(
+                self.notifier.send_digest(
+                    entries[chunk[0]]["type"],
+                    entries[chunk[0]]["identifier"],
+                    [entries[i] for i in chunk],
+                )
+                for chunk in chunks
+            ),
+        )
+
+        results = [False] * len(entries)
+        for idx, sent in zip(singles, single_results):
+            results[idx] = sent
+        for chunk, chunk_results in zip(chunks, digest_results):
+            for idx, sent in zip(chunk, chunk_results):
+                results[idx] = sent
+        return results
+
+    async def drain_once(self) -> int:
+        """대기 항목 1 batch 발송 → 처리 건수"""
+        entries = await asyncio.to_thread(self.outbox.claim_due, self.batch_size)
+        if not entries:
+            return 0
+
+        # 결과를 기록하지 못한 항목 (발송/기록 중 예외 시 finally에서 대기 상태로 복구)
+        unresolved = {entry["_key"]: entry for entry in entries}
+        try:
+            results = await self._send(entries)
+            sent = [entry for entry, ok in zip(entries, results) if ok]
+
+            await asyncio.to_thread(
+                self.outbox.mark_sent, [entry["_key"] for entry in sent]
+            )
+            for entry in sent:
+                del unresolved[entry["_key"]]
+            for entry, ok in zip(entries, results):
+                if not ok:
+                    await asyncio.to_thread(
+                        self.outbox.mark_failed,
+                        entry["_key"],
+                        entry["_attempts"],
+                        "send failed",
+                    )
+                    del unresolved[entry["_key"]]
+
+            print(f"📬 알림 발송: 성공 {len(sent)}/{len(entries)}건")
+            for entry in sent:
+                await self.log_sink.add(
+                    {
+                        "user_id": entry["user_id"],
+                        "rule_id": entry["rule_id"],
+                        "auction_id": entry["auction_id"],
+                        "channel_id": entry["channel_id"],
+                        "message": entry["text"],
+                        "sent_at": datetime.now().isoformat(),
+                        "is_read": False,
+                    }
+                )
+        finally:
+            for entry in unresolved.values():
+                try:
+                    await asyncio.to_thread(
+                        self.outbox.mark_failed,
+                        entry["_key"],
+                        entry["_attempts"],
+                        "worker error",
+                    )
+                except Exception as e:
+                    # 여기서도 실패하면 다음 시작 시 sending → pending 복구에 맡김
+                    print(f"❗ 발송 상태 복구 실패 ({entry['_key']}): {e}")
+        return len(entries)
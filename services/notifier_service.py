@@ -1,50 +1,331 @@
-import requests
 import asyncio
 import aiohttp
+from typing import Dict, List, Optional
+
+from config.settings import settings
+from services.message_renderer import truncate_lines
+from utils.rate_limiter import TokenBucket, backoff_delay
+
+# 메시지 길이 제한 (Telegram 본문/사진 설명, Slack section)
+TELEGRAM_TEXT_LIMIT = 4096
+TELEGRAM_CAPTION_LIMIT = 1024
+SLACK_SECTION_LIMIT = 3000
+# 묶음 메시지 머리말 여유분
+DIGEST_HEADER_RESERVE = 64
+
+
+def pack_texts(texts: List[str], limit: int) -> List[List[str]]:
+    """
+    항목 경계 기준으로 limit 이내 묶음으로 분할 (항목 사이 빈 줄 포함)
+    - 한 항목이 limit 을 넘으면 줄 단위로 자름
+    """
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    size = 0
+    for text in texts:
+        text = truncate_lines(text, limit)
+        added = len(text) + (2 if current else 0)
+        if current and size + added > limit:
+            chunks.append(current)
+            current, size, added = [], 0, len(text)
+        current.append(text)
+        size += added
+    if current:
+        chunks.append(current)
+    return chunks
 
 
 class NotifierService:
+    """
+    Slack / Telegram 메시지 발송기.
+    하나의 aiohttp 세션을 재사용하며, 목적지별 rate limit을 지키면서 동시 발송합니다.
+    - Telegram: 전체 초당 30건, 채팅방당 초당 1건 (그룹방은 분당 20건)
+    - Slack: 채널당 초당 1건 (chat.postMessage tier)
+    - 429 응답 시 retry_after 만큼 대기 후 재시도
+    """
+
     def __init__(self, slack_token: str = None, telegram_api_key: str = None):
         self.slack_token = slack_token
         self.telegram_api_key = telegram_api_key
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._telegram_global = TokenBucket(
+            settings.TELEGRAM_GLOBAL_RATE, settings.TELEGRAM_GLOBAL_RATE
+        )
+        self._destination_limiters: Dict[str, TokenBucket] = {}
+        self._in_flight = asyncio.Semaphore(settings.NOTIFY_MAX_IN_FLIGHT)
+
+    # ---------------------------
+    # 🔹 Session / Rate limit
+    # ---------------------------
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=settings.NOTIFY_MAX_IN_FLIGHT),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _destination_limiter(self, channel_type: str, identifier) -> TokenBucket:
+        key = f"{channel_type}:{identifier}"
+        limiter = self._destination_limiters.get(key)
+        if limiter is None:
+            if channel_type == "telegram" and str(identifier).startswith("-"):
+                rate = settings.TELEGRAM_PER_GROUP_RATE  # 그룹/채널 채팅방
+            elif channel_type == "telegram":
+                rate = settings.TELEGRAM_PER_CHAT_RATE
+            else:
+                rate = settings.SLACK_PER_CHANNEL_RATE
+            limiter = self._destination_limiters[key] = TokenBucket(rate, 1)
+        return limiter
+
+    async def _post(
+        self,
+        url: str,
+        payload: Dict,
+        limiters: List[TokenBucket],
+        headers: Optional[Dict] = None,
+    ) -> Optional[Dict]:
+        """
+        rate limit 적용 POST → 성공 시 응답 JSON, 실패 시 None
+        limiters 는 목적지 → 전체 순서로 전달 (전체 토큰은 발송 직전에 획득하여
+        느린 채팅방이 미리 받아 둔 전체 토큰으로 다른 목적지를 막지 않도록)
+        """
+        for attempt in range(settings.NOTIFY_MAX_RETRIES + 1):
+            # 목적지 대기는 동시 발송 슬롯 밖에서 (한 채팅방이 슬롯을 독점하지 않도록)
+            for limiter in limiters:
+                await limiter.acquire()
+
+            data, retry_after = None, None
+            async with self._in_flight:
+                try:
+                    async with self.session.post(
+                        url, json=payload, headers=headers
+                    ) as resp:
+                        status = resp.status
+                        retry_after = resp.headers.get("Retry-After")
+                        try:
+                            data = await resp.json(content_type=None)
+                        except ValueError:
+                            data = None
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    status = type(e).__name__
+
+            if status == 200:
+                return data
+
+            # 429 / 5xx / 네트워크 오류만 재시도
+            retryable = status == 429 or not isinstance(status, int) or status >= 500
+            if not retryable or attempt >= settings.NOTIFY_MAX_RETRIES:
+                print(f"❌ 메시지 전송 실패: {status} {data}")
+                return None
+
+            # Telegram은 본문 parameters.retry_after, Slack은 Retry-After 헤더
+            retry_after = ((data or {}).get("parameters") or {}).get(
+                "retry_after"
+            ) or retry_after
+            delay = float(retry_after) if retry_after else backoff_delay(attempt)
+            print(f"⏳ 발송 제한/오류({status}) → {delay:.1f}초 후 재시도")
+            if status == 429:
+                # 같은 목적지로 가는 다른 메시지만 함께 대기
+                # (retry_after는 채팅방/채널 단위 → 전체 limiter는 멈추지 않음)
+                limiters[0].pause(delay)
+            await asyncio.sleep(delay)
+        return None
+
+    # ---------------------------
+    # 🔹 Senders
+    # ---------------------------
 
     # ✅ Slack 메시지 발송
-    async def send_slack_message(self, channel: str, text: str):
+    async def send_slack_message(self, channel: str, text: str) -> bool:
         if not self.slack_token:
             print("⚠️ Slack 토큰이 설정되지 않았습니다.")
-            return
+            return False
 
-        url = "https://slack.com/api/chat.postMessage"
+        url = f"{settings.SLACK_API_BASE_URL}/chat.postMessage"
         headers = {"Authorization": f"Bearer {self.slack_token}"}
         payload = {"channel": channel, "text": text}
 
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None, lambda: requests.post(url, headers=headers, json=payload)
+        data = await self._post(
+            url, payload, [self._destination_limiter("slack", channel)], headers
         )
+        # Slack은 200 응답에도 ok=false로 실패를 알림
+        if not data or not data.get("ok"):
+            print(f"❌ Slack 전송 실패 → {channel}: {(data or {}).get('error')}")
+            return False
         print(f"📤 Slack 메시지 전송 완료 → {channel}")
+        return True
 
     # ✅ Telegram 메시지 발송
-    async def send_telegram_message(self, chat_id, text, image_url=None):
-        base_url = f"https://api.telegram.org/bot{self.telegram_api_key}"
+    async def send_telegram_message(self, chat_id, text, image_url=None) -> bool:
+        base_url = f"{settings.TELEGRAM_API_BASE_URL}/bot{self.telegram_api_key}"
 
         if image_url:
             url = f"{base_url}/sendPhoto"
             payload = {
                 "chat_id": chat_id,
                 "photo": image_url,
-                "caption": text,
+                "caption": truncate_lines(text, TELEGRAM_CAPTION_LIMIT),
                 "parse_mode": "Markdown",
             }
         else:
             url = f"{base_url}/sendMessage"
             payload = {
                 "chat_id": chat_id,
-                "text": text,
+                "text": truncate_lines(text, TELEGRAM_TEXT_LIMIT),
                 "parse_mode": "Markdown",
             }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as resp:
-                if resp.status != 200:
-                    print(f"❌ Telegram 전송 실패: {resp.status}")
+        data = await self._post(
+            url,
+            payload,
+            [self._destination_limiter("telegram", chat_id), self._telegram_global],
+        )
+        if not data:
+            print(f"❌ Telegram 전송 실패 → {chat_id}")
+            return False
+        return True
+
+    # ✅ 여러 메시지 동시 발송
+    async def send_many(self, messages: List[Dict]) -> List[bool]:
+        """
+        messages: [{"type": "slack"|"telegram", "identifier", "text", "image_url"}]
+        → 메시지별 성공 여부 (입력 순서 유지)
+        """
+
+        async def send(message: Dict) -> bool:
+            if message["type"] == "slack":
+                return await self.send_slack_message(
+                    message["identifier"], message["text"]
+                )
+            if message["type"] == "telegram":
+                return await self.send_telegram_message(
+                    message["identifier"],
+                    message["text"],
+                    image_url=message.get("image_url"),
+                )
+            return False
+
+        return list(await asyncio.gather(*(send(m) for m in messages)))
+
+    # ✅ 묶음(digest) 발송
+    async def send_digest(
+        self, channel_type: str, identifier, items: List[Dict]
+    ) -> List[bool]:
+        """
+        같은 목적지의 여러 알림을 한 번에 발송 → 항목별 성공 여부 (입력 순서 유지)
+        - Telegram: 사진이 2장 이상이면 media group(최대 10장), 나머지는 텍스트 묶음
+        - Slack: block 메시지 1건
+        항목의 성공 여부는 그 항목이 담긴 메시지 기준 (재시도 시 성공한 메시지는 재발송하지 않음)
+        """
+        if len(items) == 1:
+            return await self.send_many(items)
+        if channel_type == "slack":
+            return [await self._send_slack_digest(identifier, items)] * len(items)
+        if channel_type == "telegram":
+            return await self._send_telegram_digest(identifier, items)
+        return [False] * len(items)
+
+    async def _send_slack_digest(self, channel: str, items: List[Dict]) -> bool:
+        if not self.slack_token:
+            print("⚠️ Slack 토큰이 설정되지 않았습니다.")
+            return False
+
+        blocks = [
+            {
+                "type": "header",
+                "text": {"type": "plain_text", "text": f"새 매물 알림 {len(items)}건"},
+            }
+        ]
+        for item in items:
+            blocks.append({"type": "divider"})
+            blocks.append(
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": truncate_lines(item["text"], SLACK_SECTION_LIMIT),
+                    },
+                }
+            )
+
+        data = await self._post(
+            f"{settings.SLACK_API_BASE_URL}/chat.postMessage",
+            {
+                "channel": channel,
+                "text": f"새 매물 알림 {len(items)}건",
+                "blocks": blocks,
+            },
+            [self._destination_limiter("slack", channel)],
+            {"Authorization": f"Bearer {self.slack_token}"},
+        )
+        if not data or not data.get("ok"):
+            print(f"❌ Slack 묶음 전송 실패 → {channel}: {(data or {}).get('error')}")
+            return False
+        print(f"📤 Slack 묶음 메시지 전송 완료 → {channel} ({len(items)}건)")
+        return True
+
+    async def _send_telegram_digest(self, chat_id, items: List[Dict]) -> List[bool]:
+        base_url = f"{settings.TELEGRAM_API_BASE_URL}/bot{self.telegram_api_key}"
+        limiters = [
+            self._destination_limiter("telegram", chat_id),
+            self._telegram_global,
+        ]
+
+        photos = [i for i, item in enumerate(items) if item.get("image_url")]
+        if len(photos) < 2:
+            # 사진이 1장뿐이면 앨범 대신 텍스트 묶음에 포함
+            photos = []
+        # 앨범은 최대 10장, 넘치는 사진 항목은 텍스트 묶음으로
+        photos = photos[:10]
+        album = set(photos)
+        texts = [i for i in range(len(items)) if i not in album]
+
+        results = [False] * len(items)
+        if photos:
+            media = [
+                {
+                    "type": "photo",
+                    "media": items[i]["image_url"],
+                    "caption": truncate_lines(items[i]["text"], TELEGRAM_CAPTION_LIMIT),
+                    "parse_mode": "Markdown",
+                }
+                for i in photos
+            ]
+            data = await self._post(
+                f"{base_url}/sendMediaGroup",
+                {"chat_id": chat_id, "media": media},
+                limiters,
+            )
+            for i in photos:
+                results[i] = bool(data)
+
+        # 길이 제한을 넘으면 항목 경계에서 나눠 여러 메시지로 발송 (묶음은 입력 순서대로 연속)
+        offset = 0
+        for chunk in pack_texts(
+            [items[i]["text"] for i in texts],
+            TELEGRAM_TEXT_LIMIT - DIGEST_HEADER_RESERVE,
+        ):
+            text = f"📢 *새 매물 알림 {len(chunk)}건*\n\n" + "\n\n".join(chunk)
+            data = await self._post(
+                f"{base_url}/sendMessage",
+                {"chat_id": chat_id, "text": text, "parse_mode": "Markdown"},
+                limiters,
+            )
+            for i in texts[offset : offset + len(chunk)]:
+                results[i] = bool(data)
+            offset += len(chunk)
+
+        if not all(results):
+            print(
+                f"❌ Telegram 묶음 전송 일부 실패 → {chat_id} "
+                f"({results.count(False)}/{len(items)}건)"
+            )
+        return results
@@ -0,0 +1,118 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from config.settings import settings
+
+# DB 조회 실패 후 재시도 간격(초)
+RETRY_INTERVAL = 300
+
+
+class RegionCodeService:
+    """
+    시도/시군구 코드 → 이름 메모리 사전.
+    - sido_code / sigu_code 테이블을 한 번에 읽어 메모리에서 조회
+    - REGION_CODE_REFRESH_HOURS 마다 갱신, DB 조회 실패 시 스냅샷 파일 사용
+    - 시군구 코드는 시도코드 포함 5자리 (예: 26350)
+    """
+
+    def __init__(
+        self,
+        supabase,
+        snapshot_path: Optional[str] = None,
+        refresh_interval: Optional[float] = None,
+    ):
+        self.supabase = supabase
+        self.snapshot_path = snapshot_path or settings.REGION_CODE_SNAPSHOT_PATH
+        self.refresh_interval = (
+            refresh_interval
+            if refresh_interval is not None
+            else settings.REGION_CODE_REFRESH_HOURS * 60 * 60
+        )
+        self._sido: Dict[str, str] = {}
+        self._sigu: Dict[str, str] = {}
+        self._next_refresh_at = 0.0
+        self._lock = threading.Lock()
+
+    # ---------------------------
+    # 🔹 Load / Refresh
+    # ---------------------------
+
+    def refresh(self, force: bool = False):
+        """갱신 주기가 지났으면 DB에서 다시 로드"""
+        with self._lock:
+            if not force and time.time() < self._next_refresh_at:
+                return
+            try:
+                self._load_from_db()
+                self._save_snapshot()
+                self._next_refresh_at = time.time() + self.refresh_interval
+            except Exception as e:
+                print(f"⚠️ 지역 코드 조회 실패: {e}")
+                if not self._sigu:
+                    self._load_snapshot()
+                # 실패 시 조회마다 재시도하지 않고 잠시 후 다시 시도
+                self._next_refresh_at = time.time() + min(
+                    self.refresh_interval, RETRY_INTERVAL
+                )
+
+    def _load_from_db(self):
+        sido_rows = (
+            self.supabase.table("sido_code").select("sido_code, sido_name").execute()
+        ).data or []
+        sigu_rows = (
+            self.supabase.table("sigu_code").select("sigu_code, sigu_name").execute()
+        ).data or []
+
+        self._sido = {str(r["sido_code"]): r["sido_name"] for r in sido_rows}
+        self._sigu = {str(r["sigu_code"]): r["sigu_name"] for r in sigu_rows}
+        print(f"🗺 지역 코드 로드: 시도 {len(self._sido)}개, 시군구 {len(self._sigu)}개")
+
+    def _save_snapshot(self):
+        if os.path.dirname(self.snapshot_path):
+            os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+        with open(self.snapshot_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"sido": self._sido, "sigu": self._sigu},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+    def _load_snapshot(self):
+        if not os.path.exists(self.snapshot_path):
+            return
+        with open(self.snapshot_path, encoding="utf-8") as f:
+            data = json.load(f)
+        self._sido = data.get("sido", {})
+        self._sigu = data.get("sigu", {})
+        print(f"🗂 지역 코드 스냅샷 사용: {self.snapshot_path}")
+
+    # ---------------------------
+    # 🔹 Lookup
+    # ---------------------------
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._sigu)
+
+    def sido_name(self, sido_code: str) -> Optional[str]:
+        self.refresh()
+        return self._sido.get(str(sido_code))
+
+    def sigu_name(self, sigu_code: str) -> Optional[str]:
+        """시군구 이름 (sigu_code는 시도코드 포함)"""
+        self.refresh()
+        return self._sigu.get(str(sigu_code))
+
+    def is_valid(self, sido_code: str, sigu_code: str) -> bool:
+        """
+        시도/시군구(3자리) 조합이 실제 존재하는 코드인지
+        코드 사전을 불러오지 못한 경우 판단하지 않고 통과
+        """
+        self.refresh()
+        if not self.loaded:
+            return True
+        return f"{sido_code}{sigu_code}" in self._sigu
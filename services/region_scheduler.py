@@ -0,0 +1,45 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from config.settings import settings
+
+
+class RegionScheduler:
+    """
+    감시 지역 동시 크롤링 스케줄러.
+    동시에 처리하는 지역 수(max_in_flight)만 제한하고,
+    실제 요청 속도는 CrawlerEngine의 토큰 버킷이 조절합니다.
+    → 전체 소요 시간이 지역별 고정 대기 대신 허용 요청 속도에 비례합니다.
+    """
+
+    def __init__(self, max_in_flight: Optional[int] = None):
+        self.max_in_flight = max(1, max_in_flight or settings.CRAWL_MAX_IN_FLIGHT)
+
+    async def run(
+        self,
+        targets: List[Dict],
+        handler: Callable[[int, Dict], Awaitable[None]],
+    ) -> Dict[str, int]:
+        """지역별 handler(idx, target) 실행 → 성공/실패 건수 반환"""
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        started = time.monotonic()
+
+        async def run_one(idx: int, target: Dict) -> bool:
+            async with semaphore:
+                try:
+                    await handler(idx, target)
+                    return True
+                except Exception as e:
+                    print(f"❗ 지역 크롤링 실패 {target}: {e}")
+                    return False
+
+        results = await asyncio.gather(
+            *(run_one(idx, target) for idx, target in enumerate(targets))
+        )
+        succeeded = sum(results)
+        print(
+            f"⏱ 지역 {len(targets)}곳 처리 완료 (성공 {succeeded}, 실패 {len(targets) - succeeded}) "
+            f"- {time.monotonic() - started:.1f}초"
+        )
+        return {"succeeded": succeeded, "failed": len(targets) - succeeded}
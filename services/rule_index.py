@@ -0,0 +1,157 @@
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+
+def _to_float(value) -> Optional[float]:
+    """규칙 값 파싱 (빈 값/0 은 조건 없음으로 취급 → 기존 truthy 비교와 동일)"""
+    if not value:
+        return None
+    return float(value)
+
+
+def _auction_number(value) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@dataclass
+class CompiledRule:
+    """파싱이 끝난 알림 규칙"""
+
+    rule: Dict
+    sido: Optional[int] = None
+    sigu: Optional[str] = None
+    category: Optional[str] = None
+    price_min: Optional[float] = None
+    price_max: Optional[float] = None
+    area_min: Optional[float] = None
+    area_max: Optional[float] = None
+    keyword: Optional[str] = None
+
+    @classmethod
+    def from_rule(cls, rule: Dict) -> "CompiledRule":
+        sigu = None
+        if rule.get("sigu_code"):
+            # 규칙의 시군구 코드는 앞 2자리 시도코드 포함 → 제거
+            rule_sigu = str(rule["sigu_code"])
+            sigu = rule_sigu[2:] if len(rule_sigu) > 2 else rule_sigu
+
+        return cls(
+            rule=rule,
+            sido=int(rule["sido_code"]) if rule.get("sido_code") else None,
+            sigu=sigu,
+            category=rule.get("category") or None,
+            price_min=_to_float(rule.get("price_min")),
+            price_max=_to_float(rule.get("price_max")),
+            area_min=_to_float(rule.get("area_min")),
+            area_max=_to_float(rule.get("area_max")),
+            keyword=rule.get("keyword") or None,
+        )
+
+    def matches(self, auction: "AuctionView") -> bool:
+        """버킷 키(시도/시군구/카테고리)를 제외한 나머지 조건 확인"""
+        if self.price_min is not None and auction.price < self.price_min:
+            return False
+        if self.price_max is not None and auction.price > self.price_max:
+            return False
+        if self.area_min is not None and auction.area < self.area_min:
+            return False
+        if self.area_max is not None and auction.area > self.area_max:
+            return False
+        if self.keyword and self.keyword not in auction.address:
+            return False
+        return True
+
+
+@dataclass
+class AuctionView:
+    """규칙 비교용으로 한 번만 파싱한 매물 값"""
+
+    auction: Dict
+    sido: Optional[int]
+    sigu: str
+    category: Optional[str]
+    price: float
+    area: float
+    address: str
+
+    @classmethod
+    def from_auction(cls, auction: Dict) -> "AuctionView":
+        try:
+            sido = int(auction.get("sido_code", 0))
+        except (TypeError, ValueError):
+            sido = None
+        return cls(
+            auction=auction,
+            sido=sido,
+            sigu=str(auction.get("sigu_code", "0")),
+            category=auction.get("category"),
+            price=_auction_number(auction.get("minimum_price")),
+            area=_auction_number(auction.get("area")),
+            address=auction.get("address") or "",
+        )
+
+
+@dataclass
+class _Bucket:
+    """price_min 오름차순 정렬 규칙 묶음 (bisect로 최저가 조건 선필터)"""
+
+    price_mins: List[float] = field(default_factory=list)
+    rules: List[CompiledRule] = field(default_factory=list)
+
+    def candidates(self, price: float) -> List[CompiledRule]:
+        return self.rules[: bisect_right(self.price_mins, price)]
+
+
+class RuleIndex:
+    """
+    알림 규칙 인덱스.
+    규칙을 (시도, 시군구, 카테고리) 버킷으로 나누고 (조건 없음 = None),
+    매물마다 해당될 수 있는 버킷의 규칙만 비교합니다.
+    """
+
+    def __init__(self, rules: List[Dict]):
+        self._buckets: Dict[Tuple, _Bucket] = {}
+        grouped: Dict[Tuple, List[CompiledRule]] = {}
+        for rule in rules:
+            try:
+                compiled = CompiledRule.from_rule(rule)
+            except (TypeError, ValueError) as e:
+                print(f"⚠️ 잘못된 알림 규칙 → SKIP: {rule.get('id')} ({e})")
+                continue
+            key = (compiled.sido, compiled.sigu, compiled.category)
+            grouped.setdefault(key, []).append(compiled)
+
+        for key, compiled_rules in grouped.items():
+            compiled_rules.sort(
+                key=lambda r: r.price_min if r.price_min is not None else float("-inf")
+            )
+            self._buckets[key] = _Bucket(
+                price_mins=[
+                    r.price_min if r.price_min is not None else float("-inf")
+                    for r in compiled_rules
+                ],
+                rules=compiled_rules,
+            )
+        self.size = sum(len(b.rules) for b in self._buckets.values())
+
+    def match(self, auction: Dict) -> List[Dict]:
+        """매물과 일치하는 규칙 목록"""
+        view = AuctionView.from_auction(auction)
+        matched = []
+        # 값이 없는 항목은 None 버킷과 같으므로 중복 키 제거
+        keys = dict.fromkeys(
+            product((view.sido, None), (view.sigu, None), (view.category, None))
+        )
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            for compiled in bucket.candidates(view.price):
+                if compiled.matches(view):
+                    matched.append(compiled.rule)
+        return matched
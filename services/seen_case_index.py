@@ -0,0 +1,114 @@
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from config.settings import settings
+from repositories.auction_repository import AuctionRepository
+
+
+class SeenCaseIndex:
+    """
+    지금까지 저장된 모든 사건번호 인덱스 (SQLite 영구 저장 + 메모리 set).
+    - 최근 N일 스냅샷에 없는 오래된 사건도 신규로 오판하지 않도록 신규 처리 전 확인
+    - Supabase에서 마지막 created_at 이후 매물만 증분 조회하여 갱신
+    - (case_id, bo_cd) 단위, 법원코드가 없는 과거 데이터는 사건번호만으로 매칭
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.SEEN_CASES_PATH
+        self._lock = threading.Lock()
+
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_case (
+                case_id TEXT NOT NULL,
+                bo_cd TEXT NOT NULL,
+                PRIMARY KEY (case_id, bo_cd)
+            ) WITHOUT ROWID
+            """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_case_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+            """)
+        self._conn.commit()
+
+        self._keys: Set[Tuple[str, str]] = set(
+            self._conn.execute("SELECT case_id, bo_cd FROM seen_case")
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def _key(case_id: str, bo_cd: Optional[str]) -> Tuple[str, str]:
+        return str(case_id), str(bo_cd or "")
+
+    def contains(self, case_id: str, bo_cd: Optional[str] = None) -> bool:
+        return (
+            self._key(case_id, bo_cd) in self._keys
+            or self._key(case_id, None) in self._keys
+        )
+
+    def add_many(self, auctions: Iterable[Dict]):
+        """새로 저장한 매물 반영 (동기 → asyncio.to_thread 권장)"""
+        keys = [
+            self._key(a["case_id"], a.get("bo_cd"))
+            for a in auctions
+            if a.get("case_id")
+        ]
+        if not keys:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_case VALUES (?, ?)", keys
+            )
+            self._conn.commit()
+            self._keys.update(keys)
+
+    def _watermark(self) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT value FROM seen_case_meta WHERE key = 'last_created_at'"
+        ).fetchone()
+        return row[0] if row else None
+
+    def refresh(self, repo: AuctionRepository):
+        """
+        마지막 갱신 이후 생성된 매물만 조회하여 반영
+        (최초 1회는 전체 사건번호 조회, 경계 시각은 중복 조회 후 INSERT OR IGNORE)
+        """
+        with self._lock:
+            watermark = self._watermark()
+        try:
+            rows = repo.fetch_case_keys_since(
+                watermark, page_size=settings.SEEN_CASES_PAGE_SIZE
+            )
+        except Exception as e:
+            print(f"⚠️ 누적 사건번호 인덱스 갱신 실패: {e}")
+            return
+
+        keys = [
+            self._key(row["case_id"], row.get("bo_cd"))
+            for row in rows
+            if row.get("case_id")
+        ]
+        latest = max(
+            (row["created_at"] for row in rows if row.get("created_at")), default=None
+        )
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_case VALUES (?, ?)", keys
+            )
+            if latest and (watermark is None or latest > watermark):
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO seen_case_meta VALUES ('last_created_at', ?)",
+                    (latest,),
+                )
+            self._conn.commit()
+            self._keys.update(keys)
+        print(f"🗃 누적 사건번호 인덱스: {len(self._keys)}건 (증분 {len(rows)}건 조회)")
@@ -1,6 +1,6 @@
 # telegram_webhook.py
 from fastapi import FastAPI, Request
-from supabase import create_client
+from core.supabase import supabase
 import requests
 import os
 
@@ -8,8 +8,6 @@ from config.settings import settings
 
 app = FastAPI()
 
-supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
-
 
 @app.post("/")
 async def telegram_webhook(request: Request):
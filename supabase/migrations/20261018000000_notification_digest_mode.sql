@@ -0,0 +1,8 @@
+-- 알림 묶음(digest) 발송 설정
+-- true 이면 크롤 실행 단위로 일치한 매물을 모아 목적지별 한 메시지로 발송
+-- (규칙 또는 채널 중 하나라도 true 이면 묶음 발송)
+ALTER TABLE notification_rules
+    ADD COLUMN IF NOT EXISTS digest_mode boolean NOT NULL DEFAULT false;
+
+ALTER TABLE notification_channels
+    ADD COLUMN IF NOT EXISTS digest_mode boolean NOT NULL DEFAULT false;
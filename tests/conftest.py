@@ -0,0 +1,7 @@
+"""테스트 공통 설정: config.settings 필수 환경변수 기본값 (실제 접속하지 않음)"""
+
+import os
+
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:9")
+os.environ.setdefault("SUPABASE_KEY", "test")
+os.environ.setdefault("ADMIN_SECRET", "test")
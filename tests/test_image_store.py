@@ -0,0 +1,59 @@
+"""ImageStore 로컬 인덱스: (법원코드, 전체 사건번호) 단위 매칭"""
+
+import base64
+import os
+
+from services.image_store import ImageStore
+
+
+def pictures(cs_no, payload=b"jpeg-bytes"):
+    return [
+        {
+            "csNo": cs_no,
+            "cortAuctnPicSeq": "1",
+            "pageSeq": "1",
+            "picFile": base64.b64encode(payload).decode(),
+        }
+    ]
+
+
+def test_lookup_requires_same_court_and_full_case_number(tmp_path):
+    store = ImageStore(str(tmp_path), base_url="http://img")
+    store.save_case_images(pictures("20240130012345"), "2024타경12345", "B000210")
+
+    # 재스캔 후에도 검색 사건번호 / 이미지 응답 csNo 모두 같은 법원에서만 일치
+    store = ImageStore(str(tmp_path), base_url="http://img")
+    manifest = store.lookup("2024타경12345", "B000210")
+    assert manifest["court_code"] == "B000210"
+    assert store.lookup("20240130012345", "B000210") is manifest
+    assert store.lookup("2024타경12345", "B000211") is None
+    assert store.lookup("2024타기12345", "B000210") is None
+    assert store.lookup("2024타경12345", None) is None
+    assert store.representative_url(manifest, variant=None) == (
+        "http://img/B000210/20240130012345/1.jpg"
+    )
+
+
+def test_same_cs_no_in_two_courts_is_stored_separately(tmp_path):
+    store = ImageStore(str(tmp_path))
+    store.save_case_images(pictures("20240130012345", b"a"), "2024타경12345", "B1")
+    store.save_case_images(pictures("20240130012345", b"b"), "2024타경12345", "B2")
+
+    first = store.lookup("2024타경12345", "B1")
+    second = store.lookup("2024타경12345", "B2")
+    assert first["images"][0]["sha256"] != second["images"][0]["sha256"]
+
+
+def test_legacy_directory_without_court_is_a_miss(tmp_path):
+    legacy = tmp_path / "20240130012345"
+    legacy.mkdir()
+    (legacy / "1.jpg").write_bytes(b"old")
+    (legacy / "manifest.json").write_text(
+        '{"case_id": "20240130012345", "representative": "1.jpg", "images": []}',
+        encoding="utf-8",
+    )
+
+    store = ImageStore(str(tmp_path))
+    assert store.lookup("20240130012345", "B000210") is None
+    assert store.lookup("2024타경12345", "B000210") is None
+    assert os.path.exists(legacy / "1.jpg")
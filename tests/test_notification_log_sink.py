@@ -0,0 +1,45 @@
+"""NotificationLogSink: 기록 실패 후 add() 비차단, 버퍼 상한"""
+
+import asyncio
+
+from services.notification_log_sink import NotificationLogSink
+
+
+class FlakyRepo:
+    def __init__(self, fail: bool):
+        self.fail = fail
+        self.calls = 0
+        self.rows = []
+
+    def insert_notification_logs(self, batch):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("db down")
+        self.rows.extend(batch)
+
+
+def test_add_does_not_retry_inline_after_failed_flush():
+    repo = FlakyRepo(fail=True)
+    sink = NotificationLogSink(repo, batch_size=2, max_retries=0, max_buffer=5)
+
+    async def scenario():
+        for i in range(2):
+            await sink.add({"i": i})
+        failed_calls = repo.calls
+        # 실패 이후 add()는 기록을 시도하지 않고 버퍼에만 쌓음 (오래된 것부터 폐기)
+        for i in range(2, 8):
+            await sink.add({"i": i})
+        assert repo.calls == failed_calls
+        assert [row["i"] for row in sink._buffer] == [3, 4, 5, 6, 7]
+        assert sink.dropped == 3
+
+        # 주기 flush가 성공하면 add()에서의 flush도 다시 동작
+        repo.fail = False
+        await sink.flush()
+        assert [row["i"] for row in repo.rows] == [3, 4, 5, 6, 7]
+        await sink.add({"i": 8})
+        await sink.add({"i": 9})
+        assert not sink._buffer
+
+    asyncio.run(scenario())
+    assert repo.calls == 1 + 3 + 1
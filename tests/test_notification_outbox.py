@@ -0,0 +1,150 @@
+"""NotificationOutbox / OutboxWorker: 멱등 적재, 백오프와 dead letter, 발송 중 항목 복구"""
+
+import asyncio
+
+import pytest
+
+from config.settings import settings
+from services.notification_outbox import (
+    DEAD,
+    PENDING,
+    SENDING,
+    SENT,
+    NotificationOutbox,
+    OutboxWorker,
+)
+
+
+def make_entry(rule_id=1, auction_id=10, channel_id=100, **extra):
+    return {
+        "rule_id": rule_id,
+        "auction_id": auction_id,
+        "channel_id": channel_id,
+        "user_id": "u1",
+        "type": "telegram",
+        "identifier": "chat",
+        "text": "새 매물",
+        **extra,
+    }
+
+
+def row(outbox, key):
+    return outbox._conn.execute(
+        "SELECT status, attempts, next_attempt_at FROM outbox WHERE idempotency_key = ?",
+        (key,),
+    ).fetchone()
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    box = NotificationOutbox(str(tmp_path / "outbox.sqlite3"))
+    yield box
+    box._conn.close()
+
+
+def test_enqueue_is_idempotent(outbox):
+    entries = [make_entry(auction_id=1), make_entry(auction_id=2)]
+    assert outbox.enqueue(entries) == 2
+    assert outbox.enqueue(entries + [make_entry(auction_id=3)]) == 1
+    assert outbox.stats() == {PENDING: 3}
+
+    # 발송이 끝난 항목도 같은 키로는 다시 적재되지 않음
+    claimed = outbox.claim_due(10)
+    outbox.mark_sent([e["_key"] for e in claimed])
+    assert outbox.enqueue(entries) == 0
+    assert outbox.stats() == {SENT: 3}
+
+
+def test_mark_failed_backs_off_then_dead_letters(outbox, monkeypatch):
+    monkeypatch.setattr(settings, "OUTBOX_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(settings, "OUTBOX_BACKOFF_BASE", 10.0)
+    monkeypatch.setattr(settings, "OUTBOX_BACKOFF_MAX", 15.0)
+    outbox.enqueue([make_entry()])
+    key = outbox.claim_due(1)[0]["_key"]
+
+    now = 1_000.0
+    monkeypatch.setattr("services.notification_outbox.time.time", lambda: now)
+    outbox.mark_failed(key, 0, "boom")
+    assert row(outbox, key) == (PENDING, 1, now + 10.0)
+    # 백오프 전에는 다시 가져가지 않음
+    assert outbox.claim_due(1) == []
+
+    outbox.mark_failed(key, 1, "boom")
+    assert row(outbox, key) == (PENDING, 2, now + 15.0)  # 최대값으로 제한
+
+    outbox.mark_failed(key, 2, "boom")
+    assert row(outbox, key)[:2] == (DEAD, 3)
+
+
+def test_sending_rows_are_recovered_on_restart(tmp_path):
+    path = str(tmp_path / "outbox.sqlite3")
+    first = NotificationOutbox(path)
+    first.enqueue([make_entry(auction_id=1), make_entry(auction_id=2)])
+    assert len(first.claim_due(10)) == 2
+    assert first.stats() == {SENDING: 2}
+    first._conn.close()
+
+    # 발송 도중 종료된 프로세스의 항목은 재시작 시 다시 발송 대상
+    second = NotificationOutbox(path)
+    assert second.stats() == {PENDING: 2}
+    assert len(second.claim_due(10)) == 2
+    second._conn.close()
+
+
+class StubNotifier:
+    def __init__(self, results=None, error=None):
+        self.results = results
+        self.error = error
+
+    async def send_many(self, entries):
+        if self.error:
+            raise self.error
+        return self.results[: len(entries)]
+
+
+class StubSink:
+    def __init__(self, error=None):
+        self.error = error
+        self.rows = []
+
+    async def add(self, row):
+        if self.error:
+            raise self.error
+        self.rows.append(row)
+
+
+def test_drain_once_marks_each_result(outbox):
+    outbox.enqueue([make_entry(auction_id=1), make_entry(auction_id=2)])
+    sink = StubSink()
+    worker = OutboxWorker(outbox, StubNotifier(results=[True, False]), sink)
+
+    assert asyncio.run(worker.drain_once()) == 2
+    assert row(outbox, "1:1:100")[:2] == (SENT, 0)
+    assert row(outbox, "1:2:100")[:2] == (PENDING, 1)
+    assert [r["auction_id"] for r in sink.rows] == [1]
+
+
+def test_drain_once_releases_claimed_rows_when_send_raises(outbox):
+    outbox.enqueue([make_entry(auction_id=1), make_entry(auction_id=2)])
+    worker = OutboxWorker(outbox, StubNotifier(error=RuntimeError("down")), StubSink())
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(worker.drain_once())
+    # sending 상태로 남지 않고 백오프 후 재시도 대상
+    assert outbox.stats() == {PENDING: 2}
+    assert row(outbox, "1:1:100")[1] == 1
+
+
+def test_drain_once_keeps_sent_rows_when_log_sink_raises(outbox):
+    outbox.enqueue([make_entry(auction_id=1), make_entry(auction_id=2)])
+    worker = OutboxWorker(
+        outbox,
+        StubNotifier(results=[True, False]),
+        StubSink(error=RuntimeError("log")),
+    )
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(worker.drain_once())
+    # 이미 발송된 항목은 재발송하지 않음
+    assert row(outbox, "1:1:100")[:2] == (SENT, 0)
+    assert row(outbox, "1:2:100")[:2] == (PENDING, 1)
@@ -0,0 +1,50 @@
+"""NotifierService.send_digest: 메시지 단위 성공 여부를 항목별로 반환"""
+
+import asyncio
+
+from services.notifier_service import NotifierService
+
+
+def make_items(n_photos, n_texts):
+    items = [
+        {"text": f"사진 매물 {i}", "image_url": f"http://img/{i}.jpg"}
+        for i in range(n_photos)
+    ]
+    items += [{"text": f"매물 {i}", "image_url": None} for i in range(n_texts)]
+    return items
+
+
+def run_digest(items, fail_method=None):
+    notifier = NotifierService(telegram_api_key="test")
+    calls = []
+
+    async def fake_post(url, payload, limiters, headers=None):
+        method = url.rsplit("/", 1)[-1]
+        calls.append((method, payload))
+        return None if method == fail_method else {"ok": True}
+
+    notifier._post = fake_post
+    results = asyncio.run(notifier.send_digest("telegram", "chat", items))
+    return results, calls
+
+
+def test_album_failure_marks_only_album_items():
+    items = make_items(3, 2)
+    results, calls = run_digest(items, fail_method="sendMediaGroup")
+    assert [method for method, _ in calls] == ["sendMediaGroup", "sendMessage"]
+    assert results == [False, False, False, True, True]
+
+
+def test_text_failure_keeps_album_items_sent():
+    items = make_items(2, 1)
+    results, _ = run_digest(items, fail_method="sendMessage")
+    assert results == [True, True, False]
+
+
+def test_album_overflow_goes_to_text_pack():
+    items = make_items(12, 0)
+    results, calls = run_digest(items)
+    media_group, message = calls
+    assert len(media_group[1]["media"]) == 10
+    assert "사진 매물 10" in message[1]["text"] and "사진 매물 11" in message[1]["text"]
+    assert results == [True] * 12
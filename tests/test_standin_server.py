@@ -0,0 +1,172 @@
+"""benchmarks.standin_server 스모크 테스트 (서버를 빈 포트로 띄워 실제 HTTP 요청)"""
+
+import asyncio
+import json
+
+import aiohttp
+
+from benchmarks.standin_server import (
+    COUNTERS_KEY,
+    IMAGE_LIST_PATH,
+    SEARCH_PATH,
+    Faults,
+    StandinConfig,
+    start_server,
+)
+
+
+def run_with_server(config: StandinConfig, scenario):
+    async def runner():
+        server, base_url = await start_server(config)
+        try:
+            async with aiohttp.ClientSession() as session:
+                return await scenario(session, base_url, server.app)
+        finally:
+            await server.cleanup()
+
+    return asyncio.run(runner())
+
+
+def search_payload(page_no: int, page_size: int, sido="26", sigu="110") -> dict:
+    return {
+        "dma_pageInfo": {"pageNo": page_no, "pageSize": page_size},
+        "dma_srchGdsDtlSrchInfo": {"rprsAdongSdCd": sido, "rprsAdongSggCd": sigu},
+    }
+
+
+def test_search_pages_synthetic_results():
+    async def scenario(session, base_url, app):
+        pages = []
+        for page_no in (1, 3):
+            async with session.post(
+                f"{base_url}{SEARCH_PATH}", json=search_payload(page_no, 50)
+            ) as resp:
+                assert resp.status == 200
+                pages.append((await resp.json())["data"])
+        return pages
+
+    first, last = run_with_server(StandinConfig(items_per_region=120), scenario)
+    assert first["dma_pageInfo"]["totalCnt"] == "120"
+    assert len(first["dlt_srchResult"]) == 50
+    assert len(last["dlt_srchResult"]) == 20
+    assert first["dlt_srchResult"][0]["srnSaNo"] != last["dlt_srchResult"][0]["srnSaNo"]
+
+
+def test_image_list_returns_pictures():
+    async def scenario(session, base_url, app):
+        payload = {"dma_srchGdsDtlSrch": {"csNo": "2024타경1"}}
+        async with session.post(f"{base_url}{IMAGE_LIST_PATH}", json=payload) as resp:
+            return (await resp.json())["data"]["dma_result"]["csPicLst"]
+
+    pictures = run_with_server(StandinConfig(pictures_per_case=2), scenario)
+    assert [p["cortAuctnPicSeq"] for p in pictures] == ["1", "2"]
+    assert all(p["csNo"] == "2024타경1" and p["picFile"] for p in pictures)
+
+
+def test_postgrest_insert_select_upsert_patch():
+    async def scenario(session, base_url, app):
+        url = f"{base_url}/rest/v1/auctions"
+        async with session.post(
+            url, json=[{"case_id": "A", "status": "신건"}, {"case_id": "B"}]
+        ) as resp:
+            assert resp.status == 201
+            inserted = await resp.json()
+
+        async with session.post(
+            url,
+            params={"on_conflict": "id"},
+            headers={"Prefer": "resolution=merge-duplicates"},
+            json=[{"id": inserted[0]["id"], "status": "유찰"}],
+        ) as resp:
+            assert resp.status == 201
+
+        async with session.patch(
+            url, params={"case_id": "eq.B"}, json={"status": "신건"}
+        ) as resp:
+            assert resp.status == 200
+
+        async with session.get(
+            url, params={"select": "case_id,status", "order": "case_id.asc"}
+        ) as resp:
+            rows = await resp.json()
+
+        async with session.get(
+            url, headers={"Accept": "application/vnd.pgrst.object+json"}
+        ) as resp:
+            object_status = resp.status
+        return rows, object_status
+
+    rows, object_status = run_with_server(StandinConfig(), scenario)
+    assert rows == [
+        {"case_id": "A", "status": "유찰"},
+        {"case_id": "B", "status": "신건"},
+    ]
+    # 여러 행에 단일 객체 요청 → PGRST116
+    assert object_status == 406
+
+
+def test_fault_injection_by_group():
+    config = StandinConfig(
+        faults={
+            "search": Faults(error_rate=1.0),
+            "image": Faults(throttle_rate=1.0, retry_after=3),
+            "postgrest": Faults(error_rate=1.0),
+        }
+    )
+
+    async def scenario(session, base_url, app):
+        async with session.post(
+            f"{base_url}{SEARCH_PATH}", json=search_payload(1, 10)
+        ) as resp:
+            search_status = resp.status
+        async with session.post(f"{base_url}{IMAGE_LIST_PATH}", json={}) as resp:
+            image = (resp.status, resp.headers.get("Retry-After"))
+        async with session.get(f"{base_url}/rest/v1/auctions") as resp:
+            postgrest = (resp.status, await resp.json())
+        async with session.get(
+            f"{base_url}/map-geocode/v2/geocode", params={"query": "부산"}
+        ) as resp:
+            geocode_status = resp.status
+        return search_status, image, postgrest, geocode_status, dict(app[COUNTERS_KEY])
+
+    search_status, image, postgrest, geocode_status, counters = run_with_server(
+        config, scenario
+    )
+    assert search_status == 503
+    assert image == (429, "3")
+    assert postgrest[0] == 503 and postgrest[1]["code"] == "PGRST000"
+    assert geocode_status == 200
+    assert counters == {"search": 1, "image": 1, "postgrest": 1, "geocode": 1}
+
+
+def test_replays_recorded_search_fixture(tmp_path):
+    record = {
+        "url": f"https://www.courtauction.go.kr{SEARCH_PATH}",
+        "request": search_payload(1, 50, sido="11", sigu="680"),
+        "status": 200,
+        "response": {
+            "data": {
+                "dlt_srchResult": [
+                    {"srnSaNo": "2024타경100", "boCd": "B000210"},
+                    {"srnSaNo": "2024타경101", "boCd": "B000210"},
+                ]
+            }
+        },
+    }
+    (tmp_path / "searchControllerMain.on.jsonl").write_text(
+        json.dumps(record, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+
+    async def scenario(session, base_url, app):
+        async with session.post(
+            f"{base_url}{SEARCH_PATH}",
+            json=search_payload(1, 50, sido="11", sigu="680"),
+        ) as resp:
+            return (await resp.json())["data"]
+
+    data = run_with_server(StandinConfig(fixtures_dir=str(tmp_path)), scenario)
+    assert data["dma_pageInfo"]["totalCnt"] == "2"
+    assert [i["srnSaNo"] for i in data["dlt_srchResult"]] == [
+        "2024타경100",
+        "2024타경101",
+    ]
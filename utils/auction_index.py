@@ -0,0 +1,56 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class AuctionIndex:
+    """
+    기존 경매 데이터를 사건번호 기준으로 조회하기 위한 메모리 인덱스.
+    - case_id → 매물 목록 (법원이 다른 동일 사건번호 대비)
+    - (case_id, bo_cd) → 매물
+    크롤 실행 단위로 한 번 생성하고, 신규 저장 시 add()로 갱신합니다.
+    """
+
+    def __init__(self, items: Optional[Iterable[Dict]] = None):
+        self._by_case: Dict[str, List[Dict]] = {}
+        self._by_case_court: Dict[Tuple[str, str], Dict] = {}
+        if items:
+            self.add_many(items)
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._by_case.values())
+
+    def __contains__(self, case_id: str) -> bool:
+        return case_id in self._by_case
+
+    def add(self, item: Dict):
+        """매물 1건 추가 (같은 사건번호+법원이면 교체)"""
+        case_id = item.get("case_id")
+        if not case_id:
+            return
+
+        key = (case_id, item.get("bo_cd"))
+        previous = self._by_case_court.get(key)
+        bucket = self._by_case.setdefault(case_id, [])
+        if previous is not None:
+            bucket[bucket.index(previous)] = item
+        else:
+            bucket.append(item)
+        self._by_case_court[key] = item
+
+    def add_many(self, items: Iterable[Dict]):
+        for item in items:
+            self.add(item)
+
+    def get(self, case_id: str, bo_cd: Optional[str] = None) -> Optional[Dict]:
+        """
+        사건번호(+법원코드)로 기존 매물 조회
+        - bo_cd가 일치하는 매물을 우선 반환
+        - 법원코드가 없는 과거 데이터는 사건번호만으로 매칭
+        """
+        if bo_cd is not None:
+            item = self._by_case_court.get((case_id, bo_cd))
+            if item is not None:
+                return item
+            return self._by_case_court.get((case_id, None))
+
+        bucket = self._by_case.get(case_id)
+        return bucket[0] if bucket else None
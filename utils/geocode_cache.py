@@ -0,0 +1,174 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+from config.settings import settings
+
+# 캐시 miss 표시용 (None 결과 = 네이버가 찾지 못한 주소)
+MISS = object()
+
+# 조회 시각 갱신 / LRU 정리는 호출마다가 아니라 N건 단위로 묶어서 처리
+ACCESS_FLUSH_SIZE = 256
+EVICT_INTERVAL = 256
+
+
+def normalize_address(address: str) -> str:
+    """캐시 키용 주소 정규화 (공백 정리)"""
+    return re.sub(r"\s+", " ", address or "").strip()
+
+
+class GeocodeCache:
+    """
+    주소 → 좌표 영구 캐시 (SQLite).
+    - TTL 만료 / 최대 건수 초과 시 최근 사용 순(LRU)으로 정리
+    - 네이버가 찾지 못한 주소도 짧은 TTL로 저장 (negative cache)
+    - hit/miss 카운터 제공
+    - hit 시각은 메모리에 모았다가 일괄 반영, 정리는 EVICT_INTERVAL 건 저장마다 수행
+      (정리 주기 사이에는 max_entries 를 잠시 넘을 수 있음)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+        max_entries: int,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._accessed: Dict[str, float] = {}
+        self._writes = 0
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS geocode_cache (
+                address TEXT PRIMARY KEY,
+                result TEXT,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_geocode_last_access "
+            "ON geocode_cache (last_access)"
+        )
+        self._evict(time.time())
+        self._conn.commit()
+
+    def get(self, address: str):
+        """캐시 조회 → 결과 튜플, None(negative), 또는 MISS"""
+        key = normalize_address(address)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, expires_at FROM geocode_cache WHERE address = ?",
+                (key,),
+            ).fetchone()
+            if row is None or row[1] < now:
+                self.misses += 1
+                return MISS
+
+            self.hits += 1
+            self._accessed[key] = now
+            if len(self._accessed) >= ACCESS_FLUSH_SIZE:
+                self._flush_accessed()
+                self._conn.commit()
+
+        return tuple(json.loads(row[0])) if row[0] is not None else None
+
+    def get_many(self, addresses: Iterable[str]) -> Dict[str, object]:
+        """주소 묶음 조회 → {주소: 결과 튜플 / None / MISS} (지역 단위 1회 호출용)"""
+        return {address: self.get(address) for address in addresses}
+
+    def set_many(self, results: Dict[str, Optional[Tuple]]):
+        """결과 묶음 저장 (commit 1회)"""
+        now = time.time()
+        with self._lock:
+            for address, result in results.items():
+                self._insert(address, result, now)
+            self._conn.commit()
+
+    def set(self, address: str, result: Optional[Tuple]):
+        """결과 저장 (result=None 이면 negative cache)"""
+        with self._lock:
+            self._insert(address, result, time.time())
+            self._conn.commit()
+
+    def _insert(self, address: str, result: Optional[Tuple], now: float):
+        key = normalize_address(address)
+        ttl = self.ttl_seconds if result is not None else self.negative_ttl_seconds
+        payload = json.dumps(result, ensure_ascii=False) if result is not None else None
+        self._conn.execute(
+            "INSERT OR REPLACE INTO geocode_cache VALUES (?, ?, ?, ?)",
+            (key, payload, now + ttl, now),
+        )
+        self._accessed.pop(key, None)
+        self._writes += 1
+        if self._writes >= EVICT_INTERVAL:
+            self._flush_accessed()
+            self._evict(now)
+            self._writes = 0
+
+    def flush(self):
+        """모아 둔 조회 시각 반영 + 정리 (크롤 실행 종료 시 호출)"""
+        with self._lock:
+            self._flush_accessed()
+            self._evict(time.time())
+            self._writes = 0
+            self._conn.commit()
+
+    def _flush_accessed(self):
+        if not self._accessed:
+            return
+        self._conn.executemany(
+            "UPDATE geocode_cache SET last_access = ? WHERE address = ?",
+            [(at, key) for key, at in self._accessed.items()],
+        )
+        self._accessed.clear()
+
+    def _evict(self, now: float):
+        self._conn.execute("DELETE FROM geocode_cache WHERE expires_at < ?", (now,))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM geocode_cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                """
+                DELETE FROM geocode_cache WHERE address IN (
+                    SELECT address FROM geocode_cache
+                    ORDER BY last_access ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            )
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+@lru_cache
+def get_geocode_cache() -> GeocodeCache:
+    """프로세스 전역 지오코딩 캐시"""
+    day = 24 * 60 * 60
+    return GeocodeCache(
+        settings.GEOCODE_CACHE_PATH,
+        ttl_seconds=settings.GEOCODE_CACHE_TTL_DAYS * day,
+        negative_ttl_seconds=settings.GEOCODE_NEGATIVE_TTL_DAYS * day,
+        max_entries=settings.GEOCODE_CACHE_MAX_ENTRIES,
+    )
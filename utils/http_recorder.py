@@ -0,0 +1,29 @@
+import json
+import os
+from datetime import datetime
+from urllib.parse import urlparse
+
+from config.settings import settings
+
+
+def record_response(url: str, payload, status: int, data):
+    """
+    HTTP_RECORD_DIR 설정 시 요청/응답을 fixture(JSONL)로 기록
+    엔드포인트별 파일 ({경로 마지막 부분}.jsonl) → stand-in 서버에서 재생
+    """
+    if not settings.HTTP_RECORD_DIR:
+        return
+
+    os.makedirs(settings.HTTP_RECORD_DIR, exist_ok=True)
+    name = urlparse(url).path.rstrip("/").rsplit("/", 1)[-1] or "index"
+    record = {
+        "url": url,
+        "request": payload,
+        "status": status,
+        "response": data,
+        "recorded_at": datetime.now().isoformat(),
+    }
+    with open(
+        os.path.join(settings.HTTP_RECORD_DIR, f"{name}.jsonl"), "a", encoding="utf-8"
+    ) as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
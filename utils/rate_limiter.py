@@ -0,0 +1,46 @@
+import asyncio
+import random
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷 rate limiter.
+    - rate: 초당 토큰 보충 수 (= 허용 요청 수/초)
+    - capacity: 최대 누적 토큰 수 (순간 허용 burst)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """토큰을 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """서버가 대기를 요구한 경우(429 등) 버킷을 비워 일정 시간 요청 중단"""
+        self._tokens = min(self._tokens, 0) - seconds * self.rate
+        self._updated = time.monotonic()
+
+
+def backoff_delay(attempt: int, base: float = 1.0, max_delay: float = 60.0) -> float:
+    """지수 백오프 + full jitter 대기 시간(초)"""
+    return random.uniform(0, min(max_delay, base * (2**attempt)))